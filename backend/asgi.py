@@ -0,0 +1,22 @@
+"""
+ASGI 진입점
+
+Flask 앱(app.py, 라우트는 journal_api.py)을 그대로 ASGI 서버(uvicorn)에서 제공한다.
+WSGI 핸들러는 워커 프로세스마다 스레드 풀에서 실행되므로
+느린 클라이언트나 스트리밍 응답이 있어도 요청 여러 개를 동시에 처리한다.
+
+환경변수:
+    WSGI_THREADS  워커 프로세스당 핸들러 스레드 수 (기본 16)
+
+사용법:
+    gunicorn -c gunicorn.conf.py asgi:asgi_app        # 멀티 워커 (권장)
+    uvicorn asgi:asgi_app --port 5001                 # 단일 프로세스
+"""
+
+import os
+
+from a2wsgi import WSGIMiddleware
+
+from app import app
+
+asgi_app = WSGIMiddleware(app, workers=int(os.environ.get('WSGI_THREADS', '16')))
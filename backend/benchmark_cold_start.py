@@ -0,0 +1,123 @@
+"""
+서버리스 콜드 스타트 벤치마크 (api/index.py)
+
+매번 새 파이썬 프로세스에서 api/index.py를 import하고 첫 요청에 응답할 때까지의 시간을 잰다.
+인덱스 스냅샷이 있을 때와 없을 때(SQLite에서 인덱스 생성)를 비교하고,
+기준선으로 git의 최초 커밋(또는 --baseline 리비전)에 있던 api/index.py도 같은 방법으로 잰다.
+
+사용법:
+    python benchmark_cold_start.py
+    python benchmark_cold_start.py --size 20000 --runs 5 --path "/api/journals?quartile=Q1&limit=10"
+    python benchmark_cold_start.py --baseline HEAD~5
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from catalog_loader import DEFAULT_CATALOG_PATH, write_catalog, write_snapshot
+from synthetic_journals import generate_journals
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+INDEX_PATH = REPO_ROOT / 'api' / 'index.py'
+
+# 새 프로세스에서 실행하는 측정 코드
+PROBE = """
+import importlib.util, json, sys, time
+start = time.perf_counter()
+spec = importlib.util.spec_from_file_location('index', sys.argv[1])
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+imported = time.perf_counter()
+response = module.app.test_client().get(sys.argv[2])
+assert response.status_code == 200, response.status_code
+done = time.perf_counter()
+print(json.dumps({'import': imported - start, 'first_response': done - imported, 'numpy': 'numpy' in sys.modules}))
+"""
+
+
+def baseline_index(revision: Optional[str], directory: Path) -> Path:
+    """기준 리비전의 api/index.py를 directory에 꺼냄 (기본: 최초 커밋)"""
+    if revision is None:
+        revision = subprocess.run(['git', 'rev-list', '--max-parents=0', 'HEAD'], cwd=REPO_ROOT,
+                                  check=True, capture_output=True, text=True).stdout.split()[0]
+    source = subprocess.run(['git', 'show', f'{revision}:api/index.py'], cwd=REPO_ROOT,
+                            check=True, capture_output=True).stdout
+    index = directory / 'index.py'
+    index.write_bytes(source)
+    return index
+
+
+def probe(index: Path, catalog: Path, path: str) -> Dict:
+    env = {**os.environ, 'JOURNAL_CATALOG_PATH': str(catalog)}
+    output = subprocess.run([sys.executable, '-c', PROBE, str(index), path],
+                            env=env, check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def measure(cases, path: str, runs: int) -> List[Dict]:
+    """cases: (index, catalog) 목록. 기기 부하 변화가 한쪽에만 몰리지 않도록 회차마다 번갈아 잰다"""
+    results = [[] for _ in cases]
+    # 첫 회차는 버림 (파일 캐시와, 쓸 수 있으면 .pyc를 채워 기준선과 같은 조건으로 맞춘다)
+    for run_index in range(runs + 1):
+        for case_results, (index, catalog) in zip(results, cases):
+            result = probe(index, catalog, path)
+            if run_index:
+                case_results.append(result)
+    return [{
+        'import': statistics.median(r['import'] for r in case_results) * 1000,
+        'first_response': statistics.median(r['first_response'] for r in case_results) * 1000,
+        'total': statistics.median(r['import'] + r['first_response'] for r in case_results) * 1000,
+        'numpy': case_results[0]['numpy'],
+    } for case_results in results]
+
+
+def run(size, runs, path, baseline=None):
+    with tempfile.TemporaryDirectory() as tmp:
+        with_snapshot = Path(tmp) / 'snapshot' / 'journals.db'
+        without_snapshot = Path(tmp) / 'plain' / 'journals.db'
+        if size:
+            write_catalog(generate_journals(size), with_snapshot)
+        else:
+            with_snapshot.parent.mkdir()
+            shutil.copy(DEFAULT_CATALOG_PATH, with_snapshot)
+        write_snapshot(with_snapshot)
+        without_snapshot.parent.mkdir()
+        shutil.copy(with_snapshot, without_snapshot)
+        (Path(tmp) / 'baseline').mkdir()
+        baseline_path = baseline_index(baseline, Path(tmp) / 'baseline')
+
+        print("=" * 76)
+        print(f"🧊 {size or '기본 카탈로그'} | {runs}회 중앙값 | GET {path}")
+        print(f"{'catalogue':>12} | {'import (ms)':>11} | {'first resp (ms)':>15} | {'total (ms)':>10} | {'numpy':>6}")
+        print("-" * 76)
+        # 기준선은 저널 목록이 코드에 들어 있으므로 카탈로그 크기와 관계없다
+        cases = (('baseline', baseline_path, with_snapshot),
+                 ('no snapshot', INDEX_PATH, without_snapshot),
+                 ('snapshot', INDEX_PATH, with_snapshot))
+        measured = measure([(index, catalog) for _, index, catalog in cases], path, runs)
+        for (name, _, _), result in zip(cases, measured):
+            print(f"{name:>12} | {result['import']:>11.1f} | {result['first_response']:>15.1f}"
+                  f" | {result['total']:>10.1f} | {'yes' if result['numpy'] else 'no':>6}")
+        print("=" * 76)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='서버리스 콜드 스타트 벤치마크')
+    parser.add_argument('--size', type=int, default=0, help='합성 저널 수 (0이면 data/journals.db 사용)')
+    parser.add_argument('--runs', type=int, default=7)
+    parser.add_argument('--path', default='/api/search?q=nature', help='첫 요청 경로')
+    parser.add_argument('--baseline', help='기준선으로 잴 api/index.py의 git 리비전 (기본: 최초 커밋)')
+    args = parser.parse_args()
+    run(args.size, args.runs, args.path, args.baseline)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""
+목록 필터 벤치마크 (행별 파이썬 스캔 vs NumPy 마스크)
+
+사용법:
+    python benchmark_filter.py
+    python benchmark_filter.py --size 500000 --repeat 20
+"""
+
+import argparse
+import time
+
+from journal_catalog import JournalCatalog
+from synthetic_journals import CATEGORIES, generate_journals
+
+# (이름, filter_rows 인자)
+FILTERS = [
+    ('min_if', {'min_if': 10.0}),
+    ('if range', {'min_if': 2.0, 'max_if': 5.0}),
+    ('quartile', {'quartiles': ['Q1']}),
+    ('categories', {'categories': CATEGORIES[:3]}),
+    ('category substring', {'category': 'science'}),
+    ('all combined', {'categories': CATEGORIES[:5], 'quartiles': ['Q1', 'Q2'], 'min_if': 1.0, 'max_if': 20.0}),
+]
+
+
+def scan_rows(catalog, category='', categories=(), quartiles=(), min_if=None, max_if=None):
+    """레코드를 하나씩 확인하는 기준 구현"""
+    records = catalog.records
+    wanted_categories = {name.lower() for name in categories}
+    rows = []
+    for row in catalog.sorted_rows:
+        impact_factor = records.impact_factors[row]
+        row_category = records.category(row).lower()
+        if category and category.lower() not in row_category:
+            continue
+        if categories and row_category not in wanted_categories:
+            continue
+        if quartiles and records.quartile(row) not in quartiles:
+            continue
+        if min_if is not None and impact_factor < min_if:
+            continue
+        if max_if is not None and impact_factor > max_if:
+            continue
+        rows.append(row)
+    return rows
+
+
+def time_ms(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def run(size, repeat):
+    catalog = JournalCatalog(generate_journals(size))
+    print("=" * 76)
+    print(f"📚 {size:,}개 저널")
+    print(f"{'filter':>20} | {'matches':>8} | {'scan (ms)':>10} | {'mask (ms)':>10} | {'speedup':>8}")
+    print("-" * 76)
+    for name, kwargs in FILTERS:
+        rows = catalog.filter_rows(**kwargs)
+        assert rows.tolist() == scan_rows(catalog, **kwargs), name
+        scan_ms = time_ms(lambda: scan_rows(catalog, **kwargs), max(1, repeat // 10))
+        mask_ms = time_ms(lambda: catalog.filter_rows(**kwargs), repeat)
+        print(f"{name:>20} | {len(rows):>8} | {scan_ms:>10.2f} | {mask_ms:>10.2f} | {scan_ms / mask_ms:>7.0f}x")
+    print("=" * 76)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='목록 필터 벤치마크')
+    parser.add_argument('--size', type=int, default=500_000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+    run(args.size, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+"""
+퍼지 검색 지연시간 벤치마크 (p50 / p99)
+
+합성 카탈로그의 이름에 오타/약어를 넣은 서로 다른 질의로 측정한다.
+같은 질의를 반복하면 단어 확장 캐시에 모두 맞으므로 따로 표시한다.
+
+사용법:
+    python benchmark_fuzzy.py
+    python benchmark_fuzzy.py --size 100000 --queries 1000
+"""
+
+import argparse
+import random
+import time
+
+from fuzzy_search import tokenize
+from journal_catalog import JournalCatalog
+from synthetic_journals import generate_journals
+
+# 손으로 고른 인기 검색어, 오타, 약어, 드문 질의
+QUERIES = [
+    'nature', 'lancet', 'cell', 'journal', 'Lancett', 'Proc Natl Acad Sci', 'J Clin Oncol',
+    'Int J Mol Med', 'Fronteirs Neuroscience', 'Annals Surgery Reports', 'Jornal Clinical Cardiolgy',
+    'Adv Mater', 'Bull Ecology', 'Rev Mod Phys', 'Transactions Robotics Letters', 'xyzzy plugh',
+]
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p / 100))]
+
+
+def typo(word, rng):
+    """단어에 오타 하나 (삭제/교체/삽입/인접 글자 바꿈)"""
+    i = rng.randrange(len(word))
+    kind = rng.randrange(4)
+    letter = rng.choice('abcdefghijklmnopqrstuvwxyz')
+    if kind == 0:
+        return word[:i] + word[i + 1:]
+    if kind == 1:
+        return word[:i] + letter + word[i + 1:]
+    if kind == 2:
+        return word[:i] + letter + word[i:]
+    i = min(i, len(word) - 2)
+    return word[:i] + word[i + 1] + word[i] + word[i + 2:]
+
+
+def abbreviate(word, rng):
+    """약어 ("Proceedings" -> "Proc", "National" -> "Natl")"""
+    if rng.random() < 0.5:
+        return word[:rng.randint(2, 4)]
+    consonants = [ch for ch in word[1:] if ch.lower() not in 'aeiou']
+    return word[0] + ''.join(consonants[:rng.randint(1, 3)])
+
+
+def distinct_queries(journals, count, seed=1):
+    """카탈로그 이름에 오타/약어를 넣은 서로 다른 질의 count개 (단어 확장 캐시에 맞지 않게)"""
+    rng = random.Random(seed)
+    queries = dict.fromkeys(QUERIES)
+    while len(queries) < count:
+        words = rng.choice(journals)['name'].split()
+        words = rng.sample(words, rng.randint(1, min(3, len(words))))
+        query = []
+        for word in words:
+            roll = rng.random()
+            if roll < 0.4 and len(word) > 4:
+                word = typo(word, rng)
+            elif roll < 0.7 and len(word) > 4:
+                word = abbreviate(word, rng)
+            query.append(word)
+        if tokenize(' '.join(query)):
+            queries.setdefault(' '.join(query))
+    return list(queries)[:count]
+
+
+def timed_search(catalog, queries, limit):
+    latencies = []
+    for query in queries:
+        t0 = time.perf_counter()
+        catalog.fuzzy_search(query, limit)
+        latencies.append((time.perf_counter() - t0) * 1000)
+    return latencies
+
+
+def report(label, latencies):
+    print(f"{label}: p50 {percentile(latencies, 50):7.3f} ms | p99 {percentile(latencies, 99):7.3f} ms"
+          f" | max {max(latencies):7.3f} ms ({len(latencies)} queries)")
+
+
+def run(size, count, rounds, limit):
+    journals = generate_journals(size)
+    start = time.perf_counter()
+    catalog = JournalCatalog(journals)
+    catalog.warm()
+    print(f"📚 {size:,}개 저널 인덱스 생성: {time.perf_counter() - start:.2f}s")
+
+    queries = distinct_queries(journals, count)
+    # 서로 다른 질의를 처음 한 번씩 (단어 확장/저널 집합 캐시에 없는 상태, 실제 검색창 입력과 비슷)
+    distinct = timed_search(catalog, queries, limit)
+
+    # 같은 질의를 여러 번 반복 (캐시에 있는 상태)
+    rng = random.Random(0)
+    repeated = []
+    for _ in range(rounds):
+        repeated += timed_search(catalog, rng.sample(QUERIES, len(QUERIES)), limit)
+
+    print("=" * 72)
+    report('distinct', distinct)
+    report('repeated', repeated)
+    print("=" * 72)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='퍼지 검색 벤치마크')
+    parser.add_argument('--size', type=int, default=100_000)
+    parser.add_argument('--queries', type=int, default=500, help='서로 다른 오타/약어 질의 수')
+    parser.add_argument('--rounds', type=int, default=30, help='손으로 고른 질의를 반복하는 횟수')
+    parser.add_argument('--limit', type=int, default=20)
+    args = parser.parse_args()
+    run(args.size, args.queries, args.rounds, args.limit)
+
+
+if __name__ == '__main__':
+    main()
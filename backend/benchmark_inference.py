@@ -0,0 +1,79 @@
+"""
+배치 추론 벤치마크 (CPU, 초당 프레임 수)
+
+이전 방식(프레임마다 model.predict를 배치 1로 호출)과
+ModelHandler.predict_batch(전처리 후 한 번의 순전파)를 배치 크기별로 비교한다.
+학습된 모델이 없으면 같은 입력 크기의 MobileNetV2(가중치 없음)로 측정한다.
+
+사용법:
+    python benchmark_inference.py
+    python benchmark_inference.py --model models/abnormal_detector.h5 --repeat 5
+"""
+
+import os
+
+# GPU가 있어도 CPU로 측정
+os.environ.setdefault('CUDA_VISIBLE_DEVICES', '-1')
+
+import argparse
+import time
+
+import numpy as np
+from tensorflow import keras
+
+from model_handler import ModelHandler
+
+BATCH_SIZES = (1, 2, 4, 8, 16, 32, 64)
+# 1080p 카메라 프레임
+FRAME_SHAPE = (1080, 1920, 3)
+
+
+def load_model(model_path, num_classes):
+    if model_path:
+        return keras.models.load_model(model_path)
+    return keras.applications.MobileNetV2(weights=None, input_shape=(224, 224, 3), classes=num_classes)
+
+
+def frames_per_second(fn, frames, repeat):
+    fn(frames)  # 워밍업 (그래프 생성)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(frames)
+    return len(frames) * repeat / (time.perf_counter() - start)
+
+
+def run(model_path, repeat):
+    handler = ModelHandler(model_path=model_path or 'models/abnormal_detector.h5')
+    if handler.model is None:
+        handler.model = load_model(model_path, len(handler.classes))
+
+    rng = np.random.default_rng(0)
+    frames = [rng.integers(0, 256, FRAME_SHAPE, dtype=np.uint8) for _ in range(max(BATCH_SIZES))]
+
+    def predict_one_by_one(batch):
+        # 이전 predict: 프레임마다 전처리 후 model.predict (배치 1)
+        for frame in batch:
+            handler.model.predict(handler.preprocess_frame(frame), verbose=0)
+
+    baseline = frames_per_second(predict_one_by_one, frames[:16], repeat)
+    print("=" * 60)
+    print(f"🎥 {FRAME_SHAPE[1]}x{FRAME_SHAPE[0]} 프레임 | CPU | {handler.model.name}")
+    print(f"{'mode':>20} | {'frames/s':>10} | {'speedup':>8}")
+    print("-" * 60)
+    print(f"{'predict (batch 1)':>20} | {baseline:>10.1f} | {1:>7.1f}x")
+    for batch_size in BATCH_SIZES:
+        fps = frames_per_second(handler.predict_batch, frames[:batch_size], max(1, repeat * 16 // batch_size))
+        print(f"{f'predict_batch {batch_size}':>20} | {fps:>10.1f} | {fps / baseline:>7.1f}x")
+    print("=" * 60)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='배치 추론 벤치마크')
+    parser.add_argument('--model', default=None, help='Keras 모델 파일 (없으면 MobileNetV2)')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    run(args.model, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+ISSN 조회 마이크로 벤치마크 (선형 루프 vs 조회 테이블)
+
+사용법:
+    python benchmark_issn.py
+    python benchmark_issn.py --sizes 1000 100000 --lookups 2000
+"""
+
+import argparse
+import random
+import time
+
+from journal_catalog import JournalCatalog, normalize_string
+from synthetic_journals import generate_journals
+
+
+def loop_lookup(journals, issn):
+    """기존 방식: 매 요청마다 모든 ISSN을 정규화해서 비교"""
+    normalized_issn = normalize_string(issn)
+    for journal in journals:
+        if normalize_string(journal['issn']) == normalized_issn:
+            return journal
+    return None
+
+
+def without_rank(journal):
+    """카탈로그가 덧붙이는 category_top_percent를 뺀 레코드 (기존 방식 결과와 비교용)"""
+    if journal is None:
+        return None
+    return {key: value for key, value in journal.items() if key != 'category_top_percent'}
+
+
+def lookups_per_second(fn, issns):
+    start = time.perf_counter()
+    for issn in issns:
+        fn(issn)
+    return len(issns) / (time.perf_counter() - start)
+
+
+def run(sizes, lookups):
+    rng = random.Random(0)
+    print("=" * 64)
+    print(f"{'journals':>10} | {'loop (/s)':>14} | {'table (/s)':>14} | {'speedup':>10}")
+    print("-" * 64)
+    for size in sizes:
+        journals = generate_journals(size)
+        catalog = JournalCatalog(journals)
+        # 90%는 존재하는 ISSN, 10%는 없는 ISSN
+        issns = [rng.choice(journals)['issn'] if rng.random() < 0.9 else '9999-999X'
+                 for _ in range(lookups)]
+
+        for issn in issns[:100]:
+            assert without_rank(catalog.get_by_issn(issn)) == loop_lookup(journals, issn), issn
+
+        # 선형 루프는 큰 카탈로그에서 느리므로 일부만 측정
+        loop_rate = lookups_per_second(lambda i: loop_lookup(journals, i), issns[:max(10, lookups * 1000 // size)])
+        table_rate = lookups_per_second(catalog.get_by_issn, issns)
+        print(f"{size:>10} | {loop_rate:>14,.0f} | {table_rate:>14,.0f} | {table_rate / loop_rate:>9.0f}x")
+    print("=" * 64)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='ISSN 조회 벤치마크')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 50_000, 500_000])
+    parser.add_argument('--lookups', type=int, default=10_000)
+    args = parser.parse_args()
+    run(args.sizes, args.lookups)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""
+저널 레코드 메모리 벤치마크 (저널별 dict vs 필드별 배열)
+
+SQLite에서 읽은 것처럼 행마다 새 문자열을 가진 레코드로 측정한다.
+
+사용법:
+    python benchmark_memory.py
+    python benchmark_memory.py --sizes 100000 500000
+"""
+
+import argparse
+import gc
+import json
+import tracemalloc
+
+from journal_records import JournalRecords
+from synthetic_journals import generate_journals
+
+
+def retained_bytes(build):
+    """build()가 만든 객체가 유지하는 메모리 (중간에 만든 임시 객체 제외)"""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def run(sizes):
+    print("=" * 72)
+    print(f"{'journals':>10} | {'dicts (MB)':>11} | {'records (MB)':>12} | {'B/journal':>15} | {'saved':>6}")
+    print("-" * 72)
+    for size in sizes:
+        # 직렬화된 행을 다시 디코딩해서 문자열을 행마다 새로 만든다
+        encoded = [json.dumps(journal) for journal in generate_journals(size)]
+
+        dict_bytes = retained_bytes(lambda: [json.loads(row) for row in encoded])
+
+        def build_records():
+            records = JournalRecords()
+            for row in encoded:
+                records.append(json.loads(row))
+            return records
+
+        record_bytes = retained_bytes(build_records)
+
+        per_journal = f"{dict_bytes / size:.0f} -> {record_bytes / size:.0f}"
+        print(f"{size:>10} | {dict_bytes / 2**20:>11.1f} | {record_bytes / 2**20:>12.1f} | {per_journal:>15}"
+              f" | {1 - record_bytes / dict_bytes:>6.0%}")
+    print("=" * 72)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='저널 레코드 메모리 벤치마크')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 500_000])
+    args = parser.parse_args()
+    run(args.sizes)
+
+
+if __name__ == '__main__':
+    main()
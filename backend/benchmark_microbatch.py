@@ -0,0 +1,89 @@
+"""
+멀티 카메라 마이크로 배치 벤치마크 (InferenceServer)
+
+카메라 수만큼 스레드를 띄워 각자 프레임을 보내고 결과를 기다리는 것을 반복하면서
+전체 처리량(frames/s), 평균 배치 크기와 프레임당 지연 시간(p50/p99)을 잰다.
+학습된 모델이 없으면 benchmark_inference.py와 같은 MobileNetV2(가중치 없음)를 사용한다.
+
+사용법:
+    python benchmark_microbatch.py
+    python benchmark_microbatch.py --cameras 1 8 32 --max-batch-size 32 --max-wait-ms 5
+"""
+
+import os
+
+os.environ.setdefault('CUDA_VISIBLE_DEVICES', '-1')
+
+import argparse
+import threading
+import time
+
+import numpy as np
+
+from benchmark_inference import FRAME_SHAPE, load_model
+from inference_server import InferenceServer
+from model_handler import ModelHandler
+
+
+def run_cameras(server, cameras, duration, frame):
+    latencies = [[] for _ in range(cameras)]
+    stop_at = time.perf_counter() + duration
+
+    def camera(index):
+        camera_id = f'camera_{index}'
+        while time.perf_counter() < stop_at:
+            start = time.perf_counter()
+            server.analyze(frame, camera_id, timeout=30)
+            latencies[index].append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=camera, args=(i,)) for i in range(cameras)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return np.concatenate([np.array(values) for values in latencies]) * 1000, elapsed
+
+
+def run(model_path, camera_counts, max_batch_size, max_wait_ms, duration):
+    handler = ModelHandler(model_path=model_path or 'models/abnormal_detector.h5')
+    if handler.model is None:
+        handler.model = load_model(model_path, len(handler.classes))
+    frame = np.random.default_rng(0).integers(0, 256, FRAME_SHAPE, dtype=np.uint8)
+
+    print("=" * 72)
+    print(f"🎥 max batch {max_batch_size} | max wait {max_wait_ms} ms | {duration:.0f}s per run")
+    print(f"{'cameras':>8} | {'frames/s':>9} | {'avg batch':>9} | {'p50 (ms)':>9} | {'p99 (ms)':>9}")
+    print("-" * 72)
+    for cameras in camera_counts:
+        server = InferenceServer(handler, max_batch_size=max_batch_size, max_wait=max_wait_ms / 1000,
+                                 max_queue=max(256, cameras * 2))
+        server.start()
+        run_cameras(server, min(cameras, max_batch_size), 1.0, frame)  # 워밍업 (배치 크기별 그래프 생성)
+        server.stop()
+        server = InferenceServer(handler, max_batch_size=max_batch_size, max_wait=max_wait_ms / 1000,
+                                 max_queue=max(256, cameras * 2))
+        server.start()
+        latencies, elapsed = run_cameras(server, cameras, duration, frame)
+        server.stop()
+        stats = server.stats()
+        p50, p99 = np.percentile(latencies, (50, 99))
+        print(f"{cameras:>8} | {stats['frames'] / elapsed:>9.1f} | {stats['avg_batch_size']:>9.2f}"
+              f" | {p50:>9.1f} | {p99:>9.1f}")
+    print("=" * 72)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='멀티 카메라 마이크로 배치 벤치마크')
+    parser.add_argument('--model', default=None, help='Keras 모델 파일 (없으면 MobileNetV2)')
+    parser.add_argument('--cameras', type=int, nargs='+', default=[1, 4, 16, 64])
+    parser.add_argument('--max-batch-size', type=int, default=16)
+    parser.add_argument('--max-wait-ms', type=float, default=10.0)
+    parser.add_argument('--duration', type=float, default=10.0)
+    args = parser.parse_args()
+    run(args.model, args.cameras, args.max_batch_size, args.max_wait_ms, args.duration)
+
+
+if __name__ == '__main__':
+    main()
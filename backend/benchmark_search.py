@@ -0,0 +1,81 @@
+"""
+저널 검색 벤치마크 (선형 스캔 vs trigram 인덱스)
+
+사용법:
+    python benchmark_search.py
+    python benchmark_search.py --sizes 1000 50000 --repeat 20
+"""
+
+import argparse
+import time
+
+from journal_catalog import JournalCatalog, normalize_string
+from synthetic_journals import generate_journals
+
+QUERIES = ['nature', 'lancet', 'cell', 'journal of clinical', 'neuroscience letters', '0028-08', 'xyzzy', 'qu']
+
+
+def scan_search(journals, query):
+    """기존 선형 스캔 방식 검색"""
+    if not query:
+        return []
+
+    normalized_query = normalize_string(query)
+    results = []
+    for journal in journals:
+        if normalized_query in normalize_string(journal['name']):
+            results.append(journal)
+        elif normalized_query in normalize_string(journal['issn']):
+            results.append(journal)
+
+    results.sort(key=lambda x: x['impact_factor'], reverse=True)
+    return results
+
+
+def without_rank(journal):
+    """카탈로그가 덧붙이는 category_top_percent를 뺀 레코드 (기존 방식 결과와 비교용)"""
+    return {key: value for key, value in journal.items() if key != 'category_top_percent'}
+
+
+def time_per_query(fn, repeat):
+    """질의 1건당 평균 시간 (ms)"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for query in QUERIES:
+            fn(query)
+    return (time.perf_counter() - start) * 1000 / (repeat * len(QUERIES))
+
+
+def run(sizes, repeat):
+    print("=" * 72)
+    print(f"{'journals':>10} | {'build (s)':>10} | {'scan (ms)':>10} | {'index (ms)':>10} | {'speedup':>8}")
+    print("-" * 72)
+    for size in sizes:
+        journals = generate_journals(size)
+
+        start = time.perf_counter()
+        catalog = JournalCatalog(journals)
+        build_time = time.perf_counter() - start
+
+        # 결과가 기존 스캔과 동일한지 먼저 확인
+        for query in QUERIES:
+            assert list(map(without_rank, catalog.search(query))) == scan_search(journals, query), query
+
+        # 큰 카탈로그에서는 스캔이 너무 느리므로 반복 횟수를 줄인다
+        scan_repeat = max(1, repeat * 1000 // size)
+        scan_ms = time_per_query(lambda q: scan_search(journals, q), scan_repeat)
+        index_ms = time_per_query(catalog.search, repeat)
+        print(f"{size:>10} | {build_time:>10.2f} | {scan_ms:>10.3f} | {index_ms:>10.3f} | {scan_ms / index_ms:>7.1f}x")
+    print("=" * 72)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='search_journals 벤치마크')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 50_000, 500_000])
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+    run(args.sizes, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
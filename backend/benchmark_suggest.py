@@ -0,0 +1,66 @@
+"""
+자동완성 트라이 벤치마크
+
+사용법:
+    python benchmark_suggest.py
+    python benchmark_suggest.py --size 100000 --lookups 20000
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+
+from journal_catalog import JournalCatalog
+from synthetic_journals import generate_journals
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p / 100))]
+
+
+def run(size, lookups, limit):
+    journals = generate_journals(size)
+    catalog = JournalCatalog(journals)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    trie = catalog._build_suggest_trie()
+    build_time = time.perf_counter() - start
+    trie_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"📚 {size:,}개 저널 트라이 생성: {build_time:.2f}s, {trie_bytes / 1024 / 1024:.1f} MB")
+
+    # 사용자가 입력하는 것처럼 실제 이름/ISSN의 앞부분을 한 글자씩 늘려가며 조회
+    rng = random.Random(0)
+    prefixes = []
+    while len(prefixes) < lookups:
+        journal = rng.choice(journals)
+        key = journal['name'] if rng.random() < 0.9 else journal['issn']
+        prefixes.extend(key[:n] for n in range(1, min(len(key), 20) + 1))
+    prefixes = prefixes[:lookups]
+
+    latencies = []
+    for prefix in prefixes:
+        t0 = time.perf_counter()
+        catalog.suggest(prefix, limit)
+        latencies.append((time.perf_counter() - t0) * 1_000_000)
+
+    print("=" * 60)
+    print(f"lookup: p50 {percentile(latencies, 50):7.1f} µs | p99 {percentile(latencies, 99):7.1f} µs"
+          f" | max {max(latencies):7.1f} µs ({len(latencies)} prefixes)")
+    print("=" * 60)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='자동완성 벤치마크')
+    parser.add_argument('--size', type=int, default=100_000)
+    parser.add_argument('--lookups', type=int, default=20_000)
+    parser.add_argument('--limit', type=int, default=10)
+    args = parser.parse_args()
+    run(args.size, args.lookups, args.limit)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,425 @@
+"""
+저널 카탈로그 로더
+
+카탈로그는 SQLite 파일(data/journals.db)로 보관한다.
+파이썬 리터럴을 import 시점에 파싱하지 않고, 읽기 전용으로 열어 행을 한 번에 읽은 뒤 바로 닫는다.
+
+숫자/코드 열(Impact Factor, 카테고리/분위 코드, 상위 백분율, 정렬 순서와 필터용 정렬 열)은
+열 파일(data/journals.columns)에 고정 폭 배열로 저장하고 mmap으로 연다. 이 열들은 파이썬 객체가
+아니라서 참조 카운트 갱신으로 페이지가 복사되지 않고, 같은 파일을 연 모든 워커 프로세스가
+페이지 캐시의 한 벌을 공유한다. 이름/ISSN 문자열, 행 JSON과 검색 인덱스는 파이썬 객체라서
+preload_app으로 fork해도 사용하면서 워커마다 점차 복사된다.
+
+카탈로그를 만들 때 인덱스까지 만든 JournalCatalog를 pickle 스냅샷(data/journals.snapshot)으로
+함께 저장한다. 서버리스 콜드 스타트에서는 인덱스를 다시 만들지 않고 이 파일을 한 번에 읽는다.
+스냅샷은 SQLite 파일 헤더의 빌드 ID(user_version)가 같을 때만 사용하고, 없거나 맞지 않으면
+SQLite에서 다시 만든다. 스냅샷 형식은 pickle되는 클래스가 정의된 모듈(SNAPSHOT_MODULES)의
+소스 해시로 정하므로, 이 모듈들을 고치면 이전 스냅샷은 자동으로 무시된다 (다시 생성해야 빨라진다).
+
+CatalogStore는 현재 카탈로그 스냅샷 하나를 가리키는 참조를 들고 있다.
+다시 읽을 때는 백그라운드 스레드에서 새 인덱스를 모두 만든 뒤 참조만 바꾸므로
+요청 스레드는 막히지 않고, 진행 중인 요청은 이전 스냅샷으로 끝난다.
+워커 프로세스가 여러 개면 관리자 API를 받은 워커가 카탈로그 옆의 트리거 파일
+(journals.reload)을 갱신하고, 다른 워커들은 감시 스레드가 이를 보고 각자 다시 읽는다.
+
+사용법 (JSON 원본 -> SQLite 카탈로그 + 인덱스 스냅샷 + 열 파일 생성):
+    python catalog_loader.py
+    python catalog_loader.py --source ../data/journals.json --output ../data/journals.db
+"""
+
+import argparse
+import functools
+import json
+import mmap
+import os
+import pickle
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from journal_catalog import JournalCatalog
+
+DATA_DIR = Path(__file__).resolve().parent.parent / 'data'
+DEFAULT_SOURCE_PATH = DATA_DIR / 'journals.json'
+DEFAULT_CATALOG_PATH = DATA_DIR / 'journals.db'
+
+# 스냅샷에 pickle되는 클래스가 정의된 모듈 (소스가 바뀌면 스냅샷 형식이 바뀐 것으로 본다)
+SNAPSHOT_MODULES = ('journal_catalog', 'journal_records', 'fuzzy_search', 'suggest_trie',
+                    'category_distribution', 'json_codec')
+# SQLite 파일 헤더에서 user_version(빌드 ID)이 있는 위치
+USER_VERSION_OFFSET = 60
+
+# 열 파일: 매직 + 헤더 길이(4바이트) + JSON 헤더, 이어서 COLUMN_ALIGNMENT 바이트 경계마다 열 배열
+# (헤더의 열 위치는 헤더 다음 정렬 경계부터 센 바이트 위치)
+COLUMN_FILE_MAGIC = b'JCOLUMN1'
+COLUMN_ALIGNMENT = 64
+
+COLUMNS = ('name', 'issn', 'eissn', 'issn_l', 'impact_factor', 'category', 'quartile')
+OPTIONAL_COLUMNS = ('eissn', 'issn_l')
+
+SCHEMA = """
+CREATE TABLE journals (
+    name          TEXT NOT NULL,
+    issn          TEXT NOT NULL,
+    eissn         TEXT,
+    issn_l        TEXT,
+    impact_factor REAL NOT NULL,
+    category      TEXT NOT NULL,
+    quartile      TEXT NOT NULL
+)
+"""
+
+
+def catalog_path(path: Optional[os.PathLike] = None) -> Path:
+    """카탈로그 파일 경로 (인자 > JOURNAL_CATALOG_PATH 환경변수 > 기본값)"""
+    return Path(path or os.environ.get('JOURNAL_CATALOG_PATH') or DEFAULT_CATALOG_PATH)
+
+
+def trigger_path(path: Optional[os.PathLike] = None) -> Path:
+    """다른 워커에 다시 읽기를 알리는 트리거 파일 경로 (journals.db -> journals.reload)"""
+    return catalog_path(path).with_suffix('.reload')
+
+
+def columns_path(path: Optional[os.PathLike] = None) -> Path:
+    """카탈로그 옆에 두는 열 파일 경로 (journals.db -> journals.columns)"""
+    return catalog_path(path).with_suffix('.columns')
+
+
+def snapshot_path(path: Optional[os.PathLike] = None) -> Path:
+    """카탈로그 옆에 두는 인덱스 스냅샷 경로 (journals.db -> journals.snapshot)"""
+    return catalog_path(path).with_suffix('.snapshot')
+
+
+def catalog_build_id(path: Optional[os.PathLike] = None) -> int:
+    """SQLite 카탈로그의 빌드 ID (파일 헤더의 user_version, SQLite를 열지 않고 읽음)"""
+    with open(catalog_path(path), 'rb') as f:
+        header = f.read(USER_VERSION_OFFSET + 4)
+    return int.from_bytes(header[USER_VERSION_OFFSET:USER_VERSION_OFFSET + 4], 'big', signed=True)
+
+
+@functools.lru_cache(maxsize=None)
+def snapshot_format() -> int:
+    """스냅샷 형식 키 (SNAPSHOT_MODULES 소스의 CRC32)"""
+    source_dir = Path(__file__).resolve().parent
+    crc = 0
+    for name in SNAPSHOT_MODULES:
+        crc = zlib.crc32((source_dir / f'{name}.py').read_bytes(), crc)
+    return crc
+
+
+def load_journals(path: Optional[os.PathLike] = None) -> List[Dict]:
+    """SQLite 카탈로그에서 저널 레코드 목록을 읽음"""
+    path = catalog_path(path)
+    if not path.exists():
+        raise FileNotFoundError(f'Journal catalogue not found: {path} (run catalog_loader.py to build it)')
+
+    # sqlite3는 스냅샷이 없을 때만 필요하므로 콜드 스타트 import 시간을 줄이려고 여기서 import
+    import sqlite3
+
+    # immutable=1: 읽기 전용 파일로 취급해서 잠금/저널 파일을 사용하지 않음
+    conn = sqlite3.connect(f'file:{path}?mode=ro&immutable=1', uri=True)
+    try:
+        rows = conn.execute(f'SELECT {", ".join(COLUMNS)} FROM journals ORDER BY rowid').fetchall()
+    finally:
+        conn.close()
+
+    journals = []
+    for row in rows:
+        journal = dict(zip(COLUMNS, row))
+        for column in OPTIONAL_COLUMNS:
+            if journal[column] is None:
+                del journal[column]
+        journals.append(journal)
+    return journals
+
+
+def load_snapshot(path: Optional[os.PathLike] = None) -> Optional[JournalCatalog]:
+    """카탈로그와 빌드 ID가 같은 인덱스 스냅샷을 읽음 (없거나 맞지 않으면 None)"""
+    snapshot = snapshot_path(path)
+    try:
+        # 직접 만든 파일만 읽는다 (pickle은 신뢰할 수 있는 파일에만 사용)
+        data = pickle.loads(snapshot.read_bytes())
+        if data['format'] != snapshot_format() or data['build_id'] != catalog_build_id(path):
+            return None
+        return data['catalog']
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f'⚠️  인덱스 스냅샷을 읽지 못해 카탈로그에서 다시 만듭니다: {type(e).__name__}: {e}')
+        return None
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // COLUMN_ALIGNMENT) * COLUMN_ALIGNMENT
+
+
+def load_columns(path: Optional[os.PathLike] = None) -> Optional[Dict[str, memoryview]]:
+    """
+    카탈로그와 빌드 ID가 같은 열 파일을 mmap으로 열어 열 이름 -> memoryview 반환 (없거나 맞지 않으면 None)
+
+    카탈로그를 교체할 때 열 파일도 새 파일로 교체(os.replace)되므로, 이미 매핑한 이전 파일은
+    이전 카탈로그를 쓰는 요청이 끝날 때까지 그대로 읽을 수 있다.
+    """
+    try:
+        with open(columns_path(path), 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        print(f'⚠️  열 파일을 열지 못해 힙의 열 배열을 사용합니다: {type(e).__name__}: {e}')
+        return None
+
+    view = memoryview(mapped)
+    try:
+        if view[:len(COLUMN_FILE_MAGIC)] != COLUMN_FILE_MAGIC:
+            raise ValueError('not a column file')
+        start = len(COLUMN_FILE_MAGIC) + 4
+        header_size = int.from_bytes(view[len(COLUMN_FILE_MAGIC):start], 'little')
+        header = json.loads(bytes(view[start:start + header_size]))
+        if header['build_id'] != catalog_build_id(path):
+            view.release()
+            mapped.close()
+            return None
+        data = view[_aligned(start + header_size):]
+        return {
+            name: data[offset:offset + size].cast(typecode)
+            for name, (typecode, offset, size) in header['columns'].items()
+        }
+    except (KeyError, TypeError, ValueError) as e:
+        print(f'⚠️  열 파일을 읽지 못해 힙의 열 배열을 사용합니다: {type(e).__name__}: {e}')
+        return None
+
+
+def load_catalog(path: Optional[os.PathLike] = None) -> JournalCatalog:
+    """
+    인덱스까지 만든 JournalCatalog 반환 (스냅샷이 맞으면 스냅샷, 아니면 SQLite에서 생성)
+
+    열 파일이 맞으면 숫자/코드 열은 메모리 매핑된 버퍼를 사용한다.
+    """
+    catalog = load_snapshot(path)
+    if catalog is None:
+        catalog = JournalCatalog(load_journals(path))
+    columns = load_columns(path)
+    if columns is not None:
+        catalog.use_columns(columns)
+    return catalog
+
+
+class CatalogStore:
+    """원자적으로 교체되는 카탈로그 스냅샷 보관소"""
+
+    def __init__(self, path: Optional[os.PathLike] = None, lazy: bool = False):
+        """lazy: 처음 current를 읽을 때 카탈로그를 로드 (서버리스 함수의 import 시간 단축)"""
+        self.path = catalog_path(path)
+        self.trigger_path = trigger_path(path)
+        self._catalog: Optional[JournalCatalog] = None
+        self._file_signature = None
+        self.loaded_at = None
+        self.last_error: Optional[str] = None
+        self._load_lock = threading.Lock()
+        self._reload_lock = threading.Lock()
+        self._watcher: Optional[threading.Thread] = None
+        if not lazy:
+            self.load()
+
+    def load(self, warm: bool = False) -> JournalCatalog:
+        """
+        아직 로드하지 않았으면 카탈로그를 로드 (여러 스레드가 동시에 불러도 한 번만)
+
+        warm: 지연 생성 인덱스까지 모두 만듦 (장시간 실행되는 서버, gunicorn preload_app)
+        """
+        with self._load_lock:
+            if self._catalog is None:
+                signature = self._signature()
+                self._catalog = load_catalog(self.path)
+                self._file_signature = signature
+                self.loaded_at = time.time()
+            if warm:
+                self._catalog.warm()
+            return self._catalog
+
+    @property
+    def current(self) -> JournalCatalog:
+        """현재 스냅샷 (요청 하나 안에서는 한 번만 읽어서 계속 사용)"""
+        catalog = self._catalog
+        return catalog if catalog is not None else self.load()
+
+    @property
+    def reloading(self) -> bool:
+        return self._reload_lock.locked()
+
+    def _signature(self):
+        """
+        다시 읽어야 하는지 판단하기 위한 ((inode, 수정시각, 크기), 트리거 파일 수정시각)
+
+        카탈로그 파일이 없으면 None
+        """
+        try:
+            st = self.path.stat()
+        except FileNotFoundError:
+            return None
+        try:
+            triggered = self.trigger_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            triggered = None
+        return (st.st_ino, st.st_mtime_ns, st.st_size), triggered
+
+    def notify_workers(self) -> bool:
+        """
+        트리거 파일을 갱신해서 같은 카탈로그를 쓰는 다른 워커들도 다시 읽게 함
+
+        다른 워커는 watch() 감시 스레드가 트리거 파일의 수정시각이 바뀐 것을 보고 다시 읽는다.
+        파일을 쓸 수 없으면(읽기 전용 파일 시스템 등) False
+        """
+        try:
+            self.trigger_path.write_text(f'{time.time()}\n')
+        except OSError as e:
+            print(f'⚠️  다시 읽기 트리거 파일을 쓰지 못했습니다: {type(e).__name__}: {e}')
+            return False
+        return True
+
+    def reload(self) -> bool:
+        """카탈로그를 다시 읽고 교체 (이미 다시 읽는 중이면 False)"""
+        if not self._reload_lock.acquire(blocking=False):
+            return False
+        try:
+            signature = self._signature()
+            catalog = load_catalog(self.path)
+            # 스냅샷에 없는 인덱스도 교체 전에 만들어서 요청 스레드가 만들지 않게 한다
+            catalog.warm()
+        except Exception as e:
+            # 새 카탈로그를 만들지 못하면 기존 스냅샷을 그대로 사용
+            self.last_error = f'{type(e).__name__}: {e}'
+            print(f'⚠️  카탈로그 다시 읽기 실패: {self.last_error}')
+            return False
+        else:
+            self._catalog = catalog
+            self._file_signature = signature
+            self.loaded_at = time.time()
+            self.last_error = None
+            print(f'🔄 카탈로그 교체 완료: {len(catalog)}개 저널')
+            return True
+        finally:
+            self._reload_lock.release()
+
+    def reload_async(self) -> bool:
+        """백그라운드 스레드에서 다시 읽기 시작 (이미 진행 중이면 False)"""
+        if self.reloading:
+            return False
+        threading.Thread(target=self.reload, name='catalog-reload', daemon=True).start()
+        return True
+
+    def watch(self, interval: float = 5.0):
+        """카탈로그 파일이나 트리거 파일이 바뀌면 자동으로 다시 읽는 감시 스레드 시작"""
+        # fork된 워커에서는 부모의 감시 스레드가 살아 있지 않으므로 새로 시작한다
+        if self._watcher is not None and self._watcher.is_alive():
+            return
+
+        def poll():
+            while True:
+                time.sleep(interval)
+                # 마스터에서 로드한 뒤 바뀐 경우(다시 fork된 워커)에도 첫 확인에서 다시 읽는다
+                if self._signature() not in (None, self._file_signature):
+                    self.reload()
+
+        self._watcher = threading.Thread(target=poll, name='catalog-watcher', daemon=True)
+        self._watcher.start()
+
+    def status(self) -> Dict:
+        return {
+            'path': str(self.path),
+            'journals': len(self.current),
+            'version': self.current.version,
+            'loaded_at': self.loaded_at,
+            'reloading': self.reloading,
+            'last_error': self.last_error,
+        }
+
+
+def write_catalog(journals: Iterable[Dict], path: Optional[os.PathLike] = None) -> Path:
+    """저널 레코드를 SQLite 카탈로그로 저장 (임시 파일에 쓴 뒤 교체)"""
+    path = catalog_path(path)
+    rows = [[journal.get(column) for column in COLUMNS] for journal in journals]
+    # 내용으로 정한 빌드 ID (스냅샷이 같은 내용으로 만들어졌는지 확인하는 데 사용)
+    build_id = zlib.crc32(json.dumps(rows).encode('utf-8')) & 0x7fffffff
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + '.tmp')
+    if tmp_path.exists():
+        tmp_path.unlink()
+
+    import sqlite3
+
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.execute(SCHEMA)
+        conn.executemany(
+            f'INSERT INTO journals ({", ".join(COLUMNS)}) VALUES ({", ".join("?" * len(COLUMNS))})',
+            rows
+        )
+        conn.execute(f'PRAGMA user_version = {build_id}')
+        conn.commit()
+        conn.execute('VACUUM')
+    finally:
+        conn.close()
+
+    # 이미 파일을 열어 둔 프로세스는 기존 파일을 계속 읽을 수 있도록 원자적으로 교체
+    os.replace(tmp_path, path)
+    return path
+
+
+def write_columns(catalog: JournalCatalog, path: Optional[os.PathLike] = None) -> Path:
+    """카탈로그의 숫자/코드 열을 mmap으로 읽을 열 파일로 저장 (임시 파일에 쓴 뒤 교체)"""
+    buffers = {name: memoryview(column) for name, column in catalog.column_buffers().items()}
+    columns = {}
+    offset = 0
+    for name, buffer in buffers.items():
+        columns[name] = (buffer.format, offset, buffer.nbytes)
+        offset = _aligned(offset + buffer.nbytes)
+    header = json.dumps({'build_id': catalog_build_id(path), 'columns': columns}).encode('utf-8')
+    data_start = _aligned(len(COLUMN_FILE_MAGIC) + 4 + len(header))
+
+    target = columns_path(path)
+    tmp_path = target.with_name(target.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(COLUMN_FILE_MAGIC + len(header).to_bytes(4, 'little') + header)
+        for name, buffer in buffers.items():
+            f.seek(data_start + columns[name][1])
+            f.write(buffer)
+        f.truncate(data_start + offset)
+    os.replace(tmp_path, target)
+    return target
+
+
+def write_snapshot(path: Optional[os.PathLike] = None) -> Path:
+    """SQLite 카탈로그로 인덱스를 만들어 스냅샷 파일과 열 파일로 저장"""
+    catalog = JournalCatalog(load_journals(path))
+    # ETag용 내용 해시도 미리 계산해서 저장
+    catalog.content_hash
+    write_columns(catalog, path)
+    snapshot = snapshot_path(path)
+    tmp_path = snapshot.with_name(snapshot.name + '.tmp')
+    data = {'format': snapshot_format(), 'build_id': catalog_build_id(path), 'catalog': catalog}
+    tmp_path.write_bytes(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+    os.replace(tmp_path, snapshot)
+    return snapshot
+
+
+def main():
+    parser = argparse.ArgumentParser(description='JSON 저널 목록으로 SQLite 카탈로그 생성')
+    parser.add_argument('--source', default=str(DEFAULT_SOURCE_PATH), help='JSON 원본 파일')
+    parser.add_argument('--output', default=None, help='생성할 SQLite 파일')
+    args = parser.parse_args()
+
+    with open(args.source, encoding='utf-8') as f:
+        journals = json.load(f)
+
+    path = write_catalog(journals, args.output)
+    print(f"✅ {len(journals)}개 저널 -> {path}")
+    print(f"✅ 인덱스 스냅샷 -> {write_snapshot(path)}")
+    print(f"✅ 열 파일 -> {columns_path(path)}")
+
+
+if __name__ == '__main__':
+    main()
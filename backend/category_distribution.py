@@ -0,0 +1,117 @@
+"""
+정렬된 NumPy 열 배열과 카테고리별 Impact Factor 분포
+
+카탈로그를 읽을 때 NumPy로 한 번에 계산한다.
+- 카테고리별 백분위수(p25/중앙값/p75/p90)와 고정 구간 히스토그램
+- 저널마다 카테고리 안에서의 상위 백분율 (1위 / 전체 수 * 100, 동점은 같은 순위)
+
+입력은 Impact Factor 내림차순으로 정렬된 열 배열이다. 카테고리 코드로 안정 정렬하면
+각 카테고리 구간 안에서도 내림차순이 유지되므로 저널별로 다시 정렬하지 않는다.
+"""
+
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+from journal_records import JournalRecords
+
+PERCENTILES = (25, 50, 75, 90)
+# 히스토그램 구간의 하한 (마지막 구간은 상한 없음, 0 미만은 첫 구간에 포함)
+HISTOGRAM_BINS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+
+class SortedColumns:
+    """
+    정렬 순서(Impact Factor 내림차순)로 나열한 NumPy 열 배열 (필터링용)
+
+    열 파일에서 읽으면 메모리 매핑된 버퍼를 복사하지 않고 읽기 전용 배열로 감싼다.
+    """
+
+    __slots__ = ('rows', 'impact_factors', 'category_codes', 'quartile_codes')
+
+    def __init__(self, rows: np.ndarray, impact_factors: np.ndarray, category_codes: np.ndarray,
+                 quartile_codes: np.ndarray):
+        self.rows = rows
+        self.impact_factors = impact_factors
+        self.category_codes = category_codes
+        self.quartile_codes = quartile_codes
+
+    @classmethod
+    def from_records(cls, records: JournalRecords, sorted_rows: Sequence[int]) -> 'SortedColumns':
+        """레코드 열을 정렬 순서로 모아 새 배열 생성"""
+        rows = np.array(sorted_rows, dtype=np.uint32)
+        return cls(rows,
+                   np.frombuffer(records.impact_factors, dtype=np.float64)[rows],
+                   np.frombuffer(records.category_codes, dtype=np.uint32)[rows],
+                   np.frombuffer(records.quartile_codes, dtype=np.uint8)[rows])
+
+    @classmethod
+    def from_buffers(cls, rows, impact_factors, category_codes, quartile_codes) -> 'SortedColumns':
+        """열 파일의 버퍼를 복사하지 않고 감쌈"""
+        return cls(np.frombuffer(rows, dtype=np.uint32),
+                   np.frombuffer(impact_factors, dtype=np.float64),
+                   np.frombuffer(category_codes, dtype=np.uint32),
+                   np.frombuffer(quartile_codes, dtype=np.uint8))
+
+
+class Distribution:
+    """카테고리 코드별 백분위수/히스토그램과 행별 상위 백분율"""
+
+    __slots__ = ('percentiles', 'histograms', 'overall_percentiles', 'overall_histogram', 'top_percents')
+
+    def __init__(self, rows: np.ndarray, impact_factors: np.ndarray, category_codes: np.ndarray, n_categories: int):
+        """
+        rows, impact_factors, category_codes: Impact Factor 내림차순으로 나열한 열 배열
+        n_categories: 카테고리 코드 개수 (사용되지 않는 코드가 있어도 됨)
+        """
+        total = len(rows)
+        order = np.argsort(category_codes, kind='stable')
+        values = impact_factors[order]
+        codes = category_codes[order].astype(np.intp)
+        counts = np.bincount(codes, minlength=n_categories)
+        starts = np.cumsum(counts) - counts
+
+        # 백분위수: 오름차순 위치 q = p * (n - 1)을 내림차순 구간의 위치로 바꿔 선형 보간
+        sizes = counts[:, None]
+        q = np.array(PERCENTILES, dtype=np.float64)[None, :] / 100 * np.maximum(sizes - 1, 0)
+        low = np.floor(q).astype(np.intp)
+        high = np.minimum(low + 1, np.maximum(sizes - 1, 0))
+        padded = np.append(values, 0.0)  # 빈 카테고리도 인덱싱할 수 있도록
+        low_values = padded[np.minimum(starts[:, None] + sizes - 1 - low, total)]
+        high_values = padded[np.minimum(starts[:, None] + sizes - 1 - high, total)]
+        self.percentiles = low_values + (high_values - low_values) * (q - low)
+        self.overall_percentiles = (np.percentile(impact_factors, PERCENTILES) if total
+                                    else np.zeros(len(PERCENTILES)))
+
+        bins = np.maximum(np.searchsorted(HISTOGRAM_BINS, values, side='right') - 1, 0)
+        n_bins = len(HISTOGRAM_BINS)
+        self.histograms = np.bincount(codes * n_bins + bins, minlength=n_categories * n_bins).reshape(-1, n_bins)
+        self.overall_histogram = self.histograms.sum(axis=0)
+
+        # 상위 백분율: 구간 안에서 같은 값이 처음 나온 위치가 순위 (동점은 가장 높은 순위를 공유)
+        positions = np.arange(total)
+        first = np.ones(total, dtype=bool)
+        first[1:] = (codes[1:] != codes[:-1]) | (values[1:] != values[:-1])
+        ranks = np.maximum.accumulate(np.where(first, positions, 0)) - starts[codes] + 1
+        self.top_percents = np.zeros(int(rows.max()) + 1 if total else 0)
+        self.top_percents[rows[order]] = np.round(ranks * 100 / counts[codes], 2)
+
+    def summary(self, code: int) -> Dict:
+        """카테고리 하나의 백분위수와 히스토그램 (/api/stats의 category_breakdown 항목)"""
+        return percentile_fields(self.percentiles[code], self.histograms[code])
+
+
+def percentile_fields(percentiles: np.ndarray, histogram: np.ndarray, suffix: str = '_impact_factor') -> Dict:
+    """백분위수와 히스토그램 응답 필드 (예: p25_impact_factor, median_impact_factor, histogram)"""
+    fields = {
+        (f'p{p}' if p != 50 else 'median') + suffix: round(float(value), 3)
+        for p, value in zip(PERCENTILES, percentiles)
+    }
+    fields['histogram'] = histogram.tolist()
+    return fields
+
+
+def histogram_labels() -> List[str]:
+    """히스토그램 구간 이름 (예: '0-1', '100+')"""
+    edges = list(HISTOGRAM_BINS)
+    return [f'{low}-{high}' for low, high in zip(edges, edges[1:])] + [f'{edges[-1]}+']
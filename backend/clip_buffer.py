@@ -0,0 +1,94 @@
+"""
+카메라별 클립 링 버퍼
+
+3D-CNN 모델은 (16, 224, 224, 3) 클립을 입력으로 받는다. 실시간 스트림에서는 프레임이 올 때마다
+한 번만 리사이즈/RGB 변환/정규화해서 고정 크기 버퍼에 넣고, stride 프레임마다 최근 16프레임을 클립으로 내보낸다.
+겹치는 프레임은 다시 디코딩하거나 리사이즈하지 않는다.
+
+버퍼는 클립 길이의 두 배로 잡고 프레임마다 두 칸(i, i + 길이)에 쓴다.
+이렇게 하면 최근 16프레임이 항상 연속된 구간이라서 클립을 복사 없이 뷰로 꺼낼 수 있다.
+처음에 잡은 배열 외에는 프레임마다 새로 할당하지 않는다.
+"""
+
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+
+# 학습 스크립트(train_model.py)의 input_shape와 같은 값
+CLIP_LENGTH = 16
+FRAME_SIZE = (224, 224)
+
+
+class ClipBuffer:
+    """전처리된 최근 프레임을 보관하는 카메라 하나의 고정 크기 링 버퍼"""
+
+    def __init__(self, clip_length: int = CLIP_LENGTH, stride: int = 8, frame_size: Tuple[int, int] = FRAME_SIZE):
+        """
+        clip_length: 클립 프레임 수
+        stride: 클립을 내보내는 간격 (프레임 수, clip_length면 겹치지 않음)
+        frame_size: 모델 입력 프레임 크기 (너비, 높이)
+        """
+        if clip_length < 1 or stride < 1:
+            raise ValueError('clip_length and stride must be positive')
+        width, height = frame_size
+        self.clip_length = clip_length
+        self.stride = stride
+        self.frame_size = frame_size
+        self.frames = np.zeros((2 * clip_length, height, width, 3), dtype=np.float32)
+        # 리사이즈/RGB 변환 결과를 받는 작업 버퍼
+        self._resized = np.empty((height, width, 3), dtype=np.uint8)
+        self._rgb = np.empty((height, width, 3), dtype=np.uint8)
+        self.frames_seen = 0
+
+    def push(self, frame: np.ndarray) -> Optional[np.ndarray]:
+        """
+        원본 프레임 하나를 전처리해서 추가
+
+        반환값: 이번 프레임에서 윈도우가 찼으면 (clip_length, H, W, 3) 클립, 아니면 None
+        (클립은 버퍼의 뷰라서 다음 push 전까지만 유효하다. 보관하려면 복사)
+        """
+        cv2.resize(frame, self.frame_size, dst=self._resized)
+        # 학습 클립(preprocess_data.extract_frames)과 같은 RGB 순서로
+        cv2.cvtColor(self._resized, cv2.COLOR_BGR2RGB, dst=self._rgb)
+        return self.push_rgb(self._rgb)
+
+    def push_rgb(self, frame: np.ndarray) -> Optional[np.ndarray]:
+        """모델 입력 크기로 줄이고 RGB로 바꾼 uint8 프레임을 추가 (반환값은 push와 같음)"""
+        # 정규화 결과를 버퍼 칸에 바로 쓴다 (ModelHandler.preprocess_frame과 같은 값)
+        np.divide(frame, np.float32(255.0), out=self._slot(), dtype=np.float32)
+        self._commit()
+        if not self.ready():
+            return None
+        return self.clip()
+
+    def push_preprocessed(self, frame: np.ndarray):
+        """이미 전처리된 (H, W, 3) float32 프레임을 추가"""
+        self._slot()[...] = frame
+        self._commit()
+
+    def _slot(self) -> np.ndarray:
+        """다음 프레임을 쓸 칸"""
+        return self.frames[self.frames_seen % self.clip_length]
+
+    def _commit(self):
+        """방금 쓴 칸을 뒤쪽 절반에도 복사해서 최근 구간이 항상 연속되게 한다"""
+        index = self.frames_seen % self.clip_length
+        self.frames[index + self.clip_length] = self.frames[index]
+        self.frames_seen += 1
+
+    def ready(self) -> bool:
+        """마지막으로 추가한 프레임에서 클립을 내보낼 차례인지"""
+        extra = self.frames_seen - self.clip_length
+        return extra >= 0 and extra % self.stride == 0
+
+    def clip(self) -> np.ndarray:
+        """최근 clip_length개 프레임 (오래된 순서, 버퍼의 뷰)"""
+        if self.frames_seen < self.clip_length:
+            raise ValueError('Not enough frames for a clip')
+        start = self.frames_seen % self.clip_length
+        return self.frames[start:start + self.clip_length]
+
+    def reset(self):
+        """스트림이 끊겼을 때 처음부터 다시 채움"""
+        self.frames_seen = 0
@@ -0,0 +1,125 @@
+"""
+영상 프레임 샘플링
+
+ModelHandler.predict_video(일정 간격 분석)와 DataPreprocessor.extract_frames(균등 추출)가 함께 쓴다.
+
+샘플 사이 간격에 따라 읽는 방법을 고른다.
+- 간격이 키프레임 간격보다 짧으면 순차로 grab()만 하며 건너뛰고 필요한 프레임만 retrieve()한다.
+  (grab은 디코딩만 하고 BGR 이미지 변환을 하지 않는다)
+- 간격이 키프레임 간격보다 길면 CAP_PROP_POS_FRAMES로 이동한다. 이동하면 디코더가 앞쪽 키프레임부터
+  다시 디코딩하므로 한 번 이동하는 비용은 대략 GOP 하나이고, 그보다 먼 거리를 grab하는 것보다 싸다.
+- FPS를 알 수 없으면(스트림, 손상된 헤더) 프레임 타임스탬프(CAP_PROP_POS_MSEC)로 시간 간격마다 고른다.
+
+사용법:
+    sampler = FrameSampler(cap)
+    for frame_number, frame in sampler.sample_interval(1.0):   # 약 1초마다
+        ...
+    for frame_number, frame in sampler.sample_at([0, 500, 1000]):
+        ...
+"""
+
+import math
+from typing import Iterable, Iterator, Optional, Tuple
+
+import cv2
+import numpy as np
+
+# 키프레임 간격 추정값 (x264/x265 기본 keyint). OpenCV는 GOP 길이를 알려주지 않는다.
+KEYFRAME_INTERVAL = 250
+
+# FPS를 읽지 못했을 때 가정하는 값
+DEFAULT_FPS = 30.0
+
+
+class FrameSampler:
+    """VideoCapture 하나에서 필요한 프레임만 디코딩하는 샘플러"""
+
+    def __init__(self, cap: cv2.VideoCapture, keyframe_interval: int = KEYFRAME_INTERVAL):
+        self.cap = cap
+        self.keyframe_interval = keyframe_interval
+        fps = cap.get(cv2.CAP_PROP_FPS)
+        # FPS가 0이나 NaN, 비정상적으로 큰 값이면 알 수 없는 것으로 취급
+        self.fps: Optional[float] = fps if fps and math.isfinite(fps) and 0 < fps <= 1000 else None
+        # 헤더의 프레임 수 (모르면 0, 끝까지 읽으면 실제 읽은 수로 바뀜)
+        self.frame_count = max(int(cap.get(cv2.CAP_PROP_FRAME_COUNT)), 0)
+        # 다음에 grab할 프레임 번호
+        self.position = 0
+
+    def frame_skip(self, seconds: float) -> int:
+        """seconds 간격에 해당하는 프레임 수 (FPS를 모르면 DEFAULT_FPS 기준)"""
+        return max(1, round((self.fps or DEFAULT_FPS) * seconds))
+
+    def sample_interval(self, seconds: float) -> Iterator[Tuple[int, np.ndarray]]:
+        """약 seconds초마다 프레임 하나 (FPS를 모르면 타임스탬프 기준)"""
+        if self.fps is None:
+            return self.sample_by_time(seconds)
+        return self.sample_every(self.frame_skip(seconds))
+
+    def sample_every(self, step: int) -> Iterator[Tuple[int, np.ndarray]]:
+        """0, step, 2*step, ... 번째 프레임"""
+        if self.frame_count and step > self.keyframe_interval:
+            # 드문 샘플: 프레임 수를 알면 위치로 이동
+            return self.sample_at(range(0, self.frame_count, step))
+        return self._grab_every(step)
+
+    def _grab_every(self, step: int) -> Iterator[Tuple[int, np.ndarray]]:
+        """끝까지 grab하면서 step마다 retrieve (끝나면 frame_count가 실제 프레임 수)"""
+        cap = self.cap
+        while cap.grab():
+            position = self.position
+            self.position += 1
+            if position % step == 0:
+                ret, frame = cap.retrieve()
+                if not ret:
+                    break
+                yield position, frame
+        self.frame_count = self.position
+
+    def sample_at(self, indices: Iterable[int]) -> Iterator[Tuple[int, np.ndarray]]:
+        """
+        오름차순 프레임 번호 목록의 프레임
+
+        다음 번호까지의 거리가 키프레임 간격보다 멀면 위치를 이동하고, 가까우면 grab으로 건너뛴다.
+        같은 번호가 반복되면 직전 프레임을 다시 돌려준다. 파일이 먼저 끝나면 거기서 멈춘다.
+        """
+        cap = self.cap
+        last_index, last_frame = None, None
+        for index in indices:
+            index = int(index)
+            if index == last_index:
+                yield index, last_frame.copy()
+                continue
+            if index < self.position or index - self.position > self.keyframe_interval:
+                if not cap.set(cv2.CAP_PROP_POS_FRAMES, index):
+                    return
+                self.position = index
+            while self.position < index:
+                if not cap.grab():
+                    return
+                self.position += 1
+            if not cap.grab():
+                return
+            self.position += 1
+            ret, frame = cap.retrieve()
+            if not ret:
+                return
+            last_index, last_frame = index, frame
+            yield index, frame
+
+    def sample_by_time(self, seconds: float) -> Iterator[Tuple[int, np.ndarray]]:
+        """프레임 타임스탬프로 seconds초마다 첫 프레임 (가변 프레임레이트/FPS를 모르는 영상)"""
+        cap = self.cap
+        next_time = 0.0
+        while cap.grab():
+            position = self.position
+            self.position += 1
+            timestamp = cap.get(cv2.CAP_PROP_POS_MSEC) / 1000.0
+            if timestamp + 1e-6 >= next_time:
+                ret, frame = cap.retrieve()
+                if not ret:
+                    break
+                # 한동안 프레임이 없었으면 밀린 구간은 건너뛴다
+                while next_time <= timestamp + 1e-6:
+                    next_time += seconds
+                yield position, frame
+        self.frame_count = self.position
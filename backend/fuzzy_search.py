@@ -0,0 +1,302 @@
+"""
+저널 이름 퍼지 검색 인덱스
+
+질의와 저널 이름을 단어 단위로 나눠서 단어마다 다음 순서로 매칭한다.
+    1. 정확히 같은 단어
+    2. 접두어 ("Proc" -> "Proceedings")
+    3. 약어 (첫 글자가 같고 순서대로 포함: "Natl" -> "National")
+    4. 오타 (편집 거리 1~2, SymSpell 방식의 삭제 색인으로 후보 검색)
+
+포스팅 목록은 Impact Factor 순위 순서로 저장되어 있어서, 최고 점수 결과를
+필요한 개수만큼 찾으면 나머지 후보는 보지 않고 종료한다.
+단어가 하나인 질의는 점수가 높은 매칭 종류부터 포스팅을 병합하므로
+짧은 약어처럼 매칭되는 단어가 많아도 필요한 개수만큼만 읽는다.
+"""
+
+import bisect
+import heapq
+import re
+from array import array
+from collections import defaultdict
+from typing import TYPE_CHECKING, Dict, List, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# 매칭 종류별 단어 점수
+EXACT_WEIGHT = 1.0
+PREFIX_WEIGHT = 0.8
+ABBREVIATION_WEIGHT = 0.7
+TYPO_WEIGHTS = {1: 0.6, 2: 0.4}
+
+# 삭제 색인에 넣는 단어 앞부분 길이 (SymSpell의 prefix length)
+DELETE_PREFIX_LENGTH = 7
+MAX_EDIT_DISTANCE = 2
+
+STOPWORDS = frozenset({'of', 'the', 'and', 'for', 'in', 'on', 'a', 'an', 'de', 'la', 'le', 'und', 'der'})
+
+_TOKEN_RE = re.compile(r'\w+')
+
+
+def tokenize(s: str) -> List[str]:
+    """소문자 단어 목록 (불용어 제외)"""
+    return [t for t in _TOKEN_RE.findall(s.lower()) if t not in STOPWORDS]
+
+
+def max_typo_distance(token: str) -> int:
+    """단어 길이에 따라 허용하는 오타 개수"""
+    if len(token) <= 3:
+        return 0
+    if len(token) <= 6:
+        return 1
+    return MAX_EDIT_DISTANCE
+
+
+def deletes(word: str, distance: int) -> set:
+    """word에서 최대 distance개 글자를 지운 문자열 집합 (자기 자신 포함)"""
+    results = {word}
+    frontier = {word}
+    for _ in range(distance):
+        frontier = {w[:i] + w[i + 1:] for w in frontier for i in range(len(w))}
+        results |= frontier
+    return results
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """
+    제한된 Damerau-Levenshtein 거리 (limit를 넘으면 limit + 1)
+
+    Hyyrö의 비트 병렬 알고리즘으로 a의 글자 위치를 정수 비트로 나타내서
+    b의 글자마다 정수 연산 몇 번으로 한 열을 계산한다 (표 전체를 채우는 것보다 10배 이상 빠름).
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    if not a:
+        return len(b)
+    masks: Dict[str, int] = {}
+    for i, ch in enumerate(a):
+        masks[ch] = masks.get(ch, 0) | (1 << i)
+    full = (1 << len(a)) - 1
+    last = 1 << (len(a) - 1)
+    vp, vn, d0, previous = full, 0, 0, 0
+    distance = len(a)
+    for ch in b:
+        pm = masks.get(ch, 0)
+        # 인접한 두 글자가 바뀐 경우 (이전 글자의 일치 위치 다음에서 일치)
+        transposed = ((~d0 & pm) << 1) & previous
+        d0 = ((((pm & vp) + vp) ^ vp) | pm | vn | transposed) & full
+        hp = (vn | ~(d0 | vp)) & full
+        hn = d0 & vp
+        if hp & last:
+            distance += 1
+        elif hn & last:
+            distance -= 1
+        hp = ((hp << 1) | 1) & full
+        hn = (hn << 1) & full
+        vp = (hn | ~(d0 | hp)) & full
+        vn = d0 & hp
+        previous = pm
+    return distance if distance <= limit else limit + 1
+
+
+def is_abbreviation(token: str, word: str) -> bool:
+    """token이 word의 약어인지 (첫 글자가 같고 나머지 글자가 순서대로 포함)"""
+    if len(token) >= len(word) or token[0] != word[0]:
+        return False
+    position = 1
+    for ch in token[1:]:
+        position = word.find(ch, position) + 1
+        if not position:
+            return False
+    return True
+
+
+class FuzzyIndex:
+    """저널 이름 단어 기반 퍼지 검색 인덱스"""
+
+    # 단어별 매칭 결과 캐시 크기
+    EXPANSION_CACHE_SIZE = 50_000
+    # 단어별 저널 마스크 캐시의 최대 바이트 수 (마스크 하나는 저널 수만큼의 바이트)
+    RANK_MASK_CACHE_BYTES = 32 * 1024 * 1024
+
+    def __init__(self, names_by_rank: List[str]):
+        """names_by_rank: Impact Factor 순위 순서로 정렬된 저널 이름"""
+        vocabulary: Dict[str, int] = {}
+        postings = defaultdict(list)
+        self.rank_words: List[Tuple[int, ...]] = []
+        for rank, name in enumerate(names_by_rank):
+            word_ids = []
+            for token in dict.fromkeys(tokenize(name)):
+                word_id = vocabulary.setdefault(token, len(vocabulary))
+                postings[word_id].append(rank)
+                word_ids.append(word_id)
+            self.rank_words.append(tuple(word_ids))
+
+        self.words = list(vocabulary)
+        self.vocabulary = vocabulary
+        self.postings = [array('I', postings[word_id]) for word_id in range(len(self.words))]
+        self.sorted_words = sorted(self.words)
+        # 약어 후보 색인: (첫 글자 + 이후에 나오는 글자) -> 단어 (약어의 글자마다 목록이 있고 가장 짧은 것만 확인)
+        abbreviations = defaultdict(list)
+        self.delete_index: Dict[str, List[int]] = defaultdict(list)
+        for word, word_id in vocabulary.items():
+            for ch in set(word[1:]):
+                abbreviations[word[0] + ch].append(word_id)
+            for key in deletes(word[:DELETE_PREFIX_LENGTH], MAX_EDIT_DISTANCE):
+                self.delete_index[key].append(word_id)
+        self.abbreviation_index = {key: array('I', word_ids) for key, word_ids in abbreviations.items()}
+        self._expansions: Dict[str, Dict[int, float]] = {}
+        self._rank_masks: Dict[str, 'np.ndarray'] = {}
+
+    def __len__(self):
+        return len(self.rank_words)
+
+    def expand(self, token: str) -> Dict[int, float]:
+        """질의 단어 하나에 매칭되는 어휘 단어와 점수"""
+        cached = self._expansions.get(token)
+        if cached is not None:
+            return cached
+
+        matches: Dict[int, float] = {}
+
+        def offer(word_id, weight):
+            if weight > matches.get(word_id, 0.0):
+                matches[word_id] = weight
+
+        if token in self.vocabulary:
+            offer(self.vocabulary[token], EXACT_WEIGHT)
+
+        start = bisect.bisect_left(self.sorted_words, token)
+        for word in self.sorted_words[start:]:
+            if not word.startswith(token):
+                break
+            offer(self.vocabulary[word], PREFIX_WEIGHT)
+
+        if len(token) >= 2:
+            lists = [self.abbreviation_index.get(token[0] + ch, ()) for ch in set(token[1:])]
+            for word_id in min(lists, key=len):
+                if word_id not in matches and is_abbreviation(token, self.words[word_id]):
+                    offer(word_id, ABBREVIATION_WEIGHT)
+
+        distance = max_typo_distance(token)
+        if distance:
+            candidates = set()
+            for key in deletes(token[:DELETE_PREFIX_LENGTH], distance):
+                candidates.update(self.delete_index.get(key, ()))
+            # 오타 점수는 다른 매칭보다 낮으므로 이미 매칭된 단어는 거리를 계산하지 않는다
+            candidates.difference_update(matches)
+            for word_id in candidates:
+                d = edit_distance(token, self.words[word_id], distance)
+                if 0 < d <= distance:
+                    offer(word_id, TYPO_WEIGHTS[d])
+
+        if len(self._expansions) >= self.EXPANSION_CACHE_SIZE:
+            self._expansions.clear()
+        self._expansions[token] = matches
+        return matches
+
+    def _rank_mask(self, token: str, expansion: Dict[int, float]) -> 'np.ndarray':
+        """
+        질의 단어 하나에 매칭되는 저널 순위의 불리언 마스크 (캐시)
+
+        파이썬 정수 set은 원소가 많으면 GC가 돌 때마다 모든 원소를 훑어서 지연 시간이 튀므로
+        GC가 보지 않는 NumPy 배열로 만든다.
+        """
+        import numpy as np
+
+        mask = self._rank_masks.get(token)
+        if mask is None:
+            mask = np.zeros(len(self.rank_words), dtype=bool)
+            mask[np.concatenate([np.frombuffer(self.postings[w], dtype=np.uint32) for w in expansion])] = True
+            if (len(self._rank_masks) + 1) * len(mask) > self.RANK_MASK_CACHE_BYTES:
+                self._rank_masks.clear()
+            self._rank_masks[token] = mask
+        return mask
+
+    def search(self, query: str, limit: int, offset: int = 0) -> Tuple[List[Tuple[int, float]], bool]:
+        """
+        질의와 모든 단어가 매칭되는 저널을 (점수, Impact Factor) 순서로 반환
+
+        반환값: ([(rank, score), ...], 다음 페이지가 있는지)
+        """
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens or limit <= 0:
+            return [], False
+
+        expansions = [self.expand(token) for token in tokens]
+        if not all(expansions):
+            return [], False
+
+        if len(tokens) == 1:
+            return self._search_single(expansions[0], limit, offset)
+
+        # 여러 단어면 단어별 저널 마스크의 AND로 후보를 먼저 줄인다
+        masks = [self._rank_mask(token, expansion) for token, expansion in zip(tokens, expansions)]
+        candidates = masks[0] & masks[1]
+        for mask in masks[2:]:
+            candidates &= mask
+        candidate_ranks = candidates.nonzero()[0].tolist()
+        first, others = expansions[0], expansions[1:]
+        best_score = sum(max(expansion.values()) for expansion in expansions)
+
+        # limit + 1개를 찾아서 다음 페이지 존재 여부를 판단
+        needed = offset + limit + 1
+        top: List[Tuple[float, int]] = []
+        best_found = 0
+        for rank in candidate_ranks:
+            words = self.rank_words[rank]
+            score = max(first.get(w, 0.0) for w in words)
+            for expansion in others:
+                weight = max((expansion.get(w, 0.0) for w in words), default=0.0)
+                if not weight:
+                    break
+                score += weight
+            else:
+                # 순위가 낮을수록(IF가 높을수록) 같은 점수에서 앞선다
+                item = (score, -rank)
+                if len(top) < needed:
+                    heapq.heappush(top, item)
+                elif item > top[0]:
+                    heapq.heapreplace(top, item)
+                if score >= best_score - 1e-9:
+                    best_found += 1
+                    # 최고 점수 결과를 필요한 만큼 찾았으면 이후 후보는 더 나을 수 없다
+                    if best_found >= needed:
+                        break
+
+        ranked = sorted(top, reverse=True)
+        page = [(-neg_rank, round(score / len(tokens), 4)) for score, neg_rank in ranked[offset:offset + limit]]
+        return page, len(ranked) > offset + limit
+
+    def _search_single(self, expansion: Dict[int, float], limit: int,
+                       offset: int) -> Tuple[List[Tuple[int, float]], bool]:
+        """
+        단어가 하나인 질의 (저널 점수 = 매칭된 단어 중 가장 높은 점수)
+
+        점수가 같은 단어들의 포스팅을 순위 순서로 병합하면 결과 순서 그대로 나오므로,
+        높은 점수부터 필요한 개수(offset + limit + 1)가 찰 때까지만 읽는다.
+        """
+        tiers = defaultdict(list)
+        for word_id, weight in expansion.items():
+            tiers[weight].append(self.postings[word_id])
+
+        needed = offset + limit + 1
+        results: List[Tuple[int, float]] = []
+        # 더 높은 점수 단계에서 이미 나온 저널 (다음 단계는 앞 단계를 모두 읽은 뒤에만 보므로 작다)
+        seen = set()
+        for weight in sorted(tiers, reverse=True):
+            found = []
+            last_rank = -1
+            for rank in heapq.merge(*tiers[weight]):
+                if rank == last_rank or rank in seen:
+                    continue
+                last_rank = rank
+                found.append(rank)
+                if len(results) + len(found) >= needed:
+                    break
+            results.extend((rank, round(weight, 4)) for rank in found)
+            if len(results) >= needed:
+                break
+            seen.update(found)
+
+        return results[offset:offset + limit], len(results) > offset + limit
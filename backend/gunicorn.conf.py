@@ -0,0 +1,43 @@
+"""
+gunicorn 설정 (ASGI 워커)
+
+환경변수:
+    PORT             바인드 포트 (기본 5001)
+    WEB_CONCURRENCY  워커 프로세스 수 (기본: CPU 코어 수)
+
+preload_app으로 마스터 프로세스에서 카탈로그와 인덱스를 한 번만 만든 뒤 fork한다.
+숫자/코드 열은 열 파일(data/journals.columns)을 mmap한 페이지라서 모든 워커가 한 벌을 공유한다.
+문자열과 인덱스 같은 파이썬 객체는 처음에는 공유되지만, 참조 카운트가 바뀔 때마다 페이지가
+복사되므로 요청을 처리하면서 워커마다 점차 따로 갖게 된다 (gc.freeze도 이것은 막지 못한다).
+
+관리자 API(POST /api/admin/reload)는 요청을 받은 워커만 직접 다시 읽으므로, 워커마다
+감시 스레드를 띄워 트리거 파일(data/journals.reload)이 바뀌면 각자 다시 읽게 한다.
+CATALOG_WATCH_INTERVAL을 지정하지 않으면 WORKER_WATCH_INTERVAL초마다 확인한다.
+"""
+
+import gc
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5001')}"
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count()))
+worker_class = 'uvicorn_worker.UvicornWorker'
+preload_app = True
+keepalive = 5
+
+# 워커가 다시 읽기 트리거를 확인하는 간격 (초, 파일 두 개를 stat할 뿐이라 비용은 거의 없다)
+WORKER_WATCH_INTERVAL = 5.0
+accesslog = os.environ.get('ACCESS_LOG') or None
+
+
+def pre_fork(server, worker):
+    # 지금까지 만든 객체(카탈로그/인덱스)를 GC 대상에서 빼서
+    # 워커에서 GC가 돌 때 모든 객체를 훑으며 페이지를 복사하지 않도록 한다
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    # fork 이전에 시작한 카탈로그 감시 스레드는 워커로 복제되지 않으므로 다시 시작
+    # (다른 워커가 받은 관리자 다시 읽기도 이 스레드가 트리거 파일로 전달받는다)
+    from journal_api import CATALOG_WATCH_INTERVAL, STORE
+    STORE.watch(CATALOG_WATCH_INTERVAL if CATALOG_WATCH_INTERVAL > 0 else WORKER_WATCH_INTERVAL)
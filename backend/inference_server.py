@@ -0,0 +1,371 @@
+"""
+멀티 카메라 추론 서버 (마이크로 배치)
+
+여러 camera_id의 프레임을 동시에 받아 하나의 큐에 넣고, 스케줄러 스레드가
+최대 배치 크기(max_batch_size)나 최대 대기 시간(max_wait)까지 모은 프레임을
+공유 모델 하나로 한 번에 추론한 뒤 각 요청에 결과를 돌려준다.
+
+- 리사이즈/정규화는 요청 스레드에서 병렬로 하고, 스케줄러는 순전파만 한다.
+- 배치 배열은 미리 할당해서 재사용하고, 배치 크기를 2의 거듭제곱으로 맞춰서
+  모델 그래프가 배치 크기마다 다시 만들어지지 않게 한다.
+- 대기열이 가득 차면 바로 거절(503)해서 프레임당 지연 시간이 끝없이 늘어나지 않게 한다.
+- 3D-CNN(클립 입력) 모델이면 카메라별 ClipBuffer에 프레임을 쌓고 stride마다 클립을 추론한다.
+- 카메라별 상태(프레임 번호, 클립 버퍼)는 MAX_CAMERAS개까지만 둔다. 가득 차면 CAMERA_IDLE_TIMEOUT
+  동안 프레임이 없던 카메라를 정리하고, 그래도 자리가 없으면 새 카메라를 거절(503)한다.
+
+환경변수:
+    MAX_BATCH_SIZE     배치 최대 크기 (기본 16)
+    MAX_BATCH_WAIT_MS  첫 프레임 이후 배치를 모으는 최대 시간 (기본 10)
+    MAX_QUEUE          대기열 최대 길이 (기본 256)
+    FRAME_TIMEOUT      요청 하나가 결과를 기다리는 최대 시간 (초, 기본 5)
+    MAX_CAMERAS        동시에 상태를 유지하는 최대 카메라 수 (기본 64)
+    CAMERA_IDLE_TIMEOUT  이 시간(초) 동안 프레임이 없던 카메라는 정리 대상 (기본 300)
+
+사용법:
+    python inference_server.py
+    curl -X POST http://localhost:5000/api/analyze-frame \\
+      -H "Content-Type: application/json" \\
+      -d '{"frame": "BASE64_ENCODED_IMAGE", "camera_id": "camera_1"}'
+"""
+
+import base64
+import binascii
+import os
+import queue
+import threading
+import time
+from collections import Counter, deque
+from concurrent import futures
+from concurrent.futures import Future
+from typing import Dict, List, Optional
+
+import cv2
+import numpy as np
+from flask import Flask, jsonify, request
+from flask_cors import CORS
+
+from model_handler import ModelHandler
+
+
+class QueueFull(Exception):
+    """대기열이 가득 차서 프레임을 받을 수 없음"""
+
+
+class TooManyCameras(Exception):
+    """카메라 수 제한에 걸려 새 카메라의 프레임을 받을 수 없음"""
+
+
+class _Pending:
+    """대기열에 들어간 전처리된 프레임(또는 클립) 하나"""
+
+    __slots__ = ('data', 'camera_id', 'frame_number', 'enqueued_at', 'future')
+
+    def __init__(self, data: np.ndarray, camera_id: str, frame_number: int):
+        self.data = data
+        self.camera_id = camera_id
+        self.frame_number = frame_number
+        self.enqueued_at = time.perf_counter()
+        self.future: Future = Future()
+
+
+class InferenceServer:
+    """여러 카메라의 프레임을 마이크로 배치로 묶어 공유 모델 하나로 추론"""
+
+    def __init__(self, handler: ModelHandler, max_batch_size: int = 16, max_wait: float = 0.01,
+                 max_queue: int = 256, max_cameras: int = 64, camera_idle_timeout: float = 300.0):
+        """
+        max_batch_size: 한 번의 순전파에 넣을 최대 프레임 수
+        max_wait: 첫 프레임이 들어온 뒤 배치를 더 모으는 최대 시간 (초)
+        max_queue: 대기열 최대 길이 (넘으면 QueueFull)
+        max_cameras: 상태를 유지하는 최대 카메라 수 (클립 모델은 카메라마다 약 19MB 버퍼)
+        camera_idle_timeout: 자리가 없을 때 이 시간(초) 동안 프레임이 없던 카메라를 정리
+        """
+        self.handler = handler
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.max_cameras = max_cameras
+        self.camera_idle_timeout = camera_idle_timeout
+        self._queue: 'queue.Queue[Optional[_Pending]]' = queue.Queue(maxsize=max_queue)
+        self._thread: Optional[threading.Thread] = None
+        self._batch_buffer: Optional[np.ndarray] = None
+        # 카메라별 프레임 번호, 클립 버퍼 접근 잠금과 마지막 프레임 시각
+        self._frame_numbers: Dict[str, int] = {}
+        self._camera_locks: Dict[str, threading.Lock] = {}
+        self._last_seen: Dict[str, float] = {}
+        self._cameras_lock = threading.Lock()
+        # 통계 (rejected/evicted_cameras 외에는 스케줄러 스레드만 쓴다)
+        self.batches = 0
+        self.frames = 0
+        self.rejected = 0
+        self.evicted_cameras = 0
+        self._latencies: deque = deque(maxlen=4096)
+
+    # ------------------------------------------------------------------
+    # 요청 스레드
+    # ------------------------------------------------------------------
+
+    def start(self):
+        """스케줄러 스레드 시작 (이미 실행 중이면 무시)"""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name='inference-scheduler', daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """대기 중인 프레임을 모두 처리한 뒤 스케줄러 종료"""
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+
+    def _camera_lock(self, camera_id: str) -> threading.Lock:
+        """카메라의 잠금 (처음 보는 카메라면 자리를 확인하고 등록, 없으면 TooManyCameras)"""
+        now = time.monotonic()
+        with self._cameras_lock:
+            lock = self._camera_locks.get(camera_id)
+            if lock is None:
+                if len(self._camera_locks) >= self.max_cameras:
+                    self._evict_idle_cameras(now)
+                if len(self._camera_locks) >= self.max_cameras:
+                    self.rejected += 1
+                    raise TooManyCameras(f'Too many active cameras ({self.max_cameras})')
+                lock = self._camera_locks[camera_id] = threading.Lock()
+            self._last_seen[camera_id] = now
+        return lock
+
+    def _evict_idle_cameras(self, now: float):
+        """camera_idle_timeout 동안 프레임이 없던 카메라의 상태 정리 (_cameras_lock 안에서 호출)"""
+        for camera_id, last_seen in list(self._last_seen.items()):
+            if now - last_seen < self.camera_idle_timeout:
+                continue
+            lock = self._camera_locks[camera_id]
+            # 아직 프레임을 처리 중인 카메라는 건너뛴다
+            if not lock.acquire(blocking=False):
+                continue
+            try:
+                del self._camera_locks[camera_id]
+                del self._last_seen[camera_id]
+                self._frame_numbers.pop(camera_id, None)
+                self.handler.clip_buffers.pop(camera_id, None)
+                self.evicted_cameras += 1
+            finally:
+                lock.release()
+
+    def submit(self, frame: np.ndarray, camera_id: str) -> Optional[Future]:
+        """
+        원본 프레임 하나를 전처리해서 대기열에 넣음
+
+        반환값: 결과 dict를 돌려줄 Future
+                (클립 모델에서 아직 클립을 추론할 차례가 아니면 None)
+        카메라 수 제한에 걸리면 TooManyCameras, 대기열이 가득 차면 QueueFull
+        """
+        handler = self.handler
+        with self._camera_lock(camera_id):
+            frame_number = self._frame_numbers.get(camera_id, 0)
+            self._frame_numbers[camera_id] = frame_number + 1
+            if handler.uses_clips:
+                # 카메라 하나의 프레임은 순서대로 버퍼에 넣어야 하므로 잠금 안에서 처리
+                clip = handler.clip_buffer(camera_id).push(frame)
+                if clip is None:
+                    return None
+                # 버퍼의 뷰는 다음 프레임에서 덮어써지므로 대기열에는 복사본을 넣는다
+                data = clip.copy()
+            else:
+                data = None
+        if data is None:
+            data = handler.preprocess_batch([frame])[0]
+
+        pending = _Pending(data, camera_id, frame_number)
+        try:
+            self._queue.put_nowait(pending)
+        except queue.Full:
+            self.rejected += 1
+            raise QueueFull(f'Inference queue is full ({self._queue.maxsize} frames)')
+        return pending.future
+
+    def analyze(self, frame: np.ndarray, camera_id: str, timeout: Optional[float] = None) -> Optional[Dict]:
+        """submit 후 결과를 기다림 (클립을 모으는 중이면 None)"""
+        future = self.submit(frame, camera_id)
+        return None if future is None else future.result(timeout)
+
+    # ------------------------------------------------------------------
+    # 스케줄러 스레드
+    # ------------------------------------------------------------------
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            first = self._queue.get()
+            if first is None:
+                break
+            batch = [first]
+            deadline = time.perf_counter() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.perf_counter()
+                try:
+                    # 대기 시간이 지나도 이미 큐에 있는 프레임은 함께 처리한다
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            try:
+                self._run_batch(batch)
+            except Exception as e:
+                # 예상하지 못한 오류로 스케줄러 스레드가 멈추면 이후 요청이 모두 시간 초과된다
+                for pending in batch:
+                    if not pending.future.done():
+                        pending.future.set_exception(e)
+
+    def _padded_size(self, size: int) -> int:
+        """배치 크기를 2의 거듭제곱(최대 max_batch_size)으로 올림"""
+        padded = 1
+        while padded < size:
+            padded *= 2
+        return min(padded, self.max_batch_size)
+
+    def _run_batch(self, batch: List[_Pending]):
+        # 배치 안에서 가장 많은 형태를 입력 형태로 쓰고, 넣을 수 없는 항목은 그 항목만 실패시킨다
+        item_shape = Counter(np.shape(pending.data) for pending in batch).most_common(1)[0][0]
+        if self._batch_buffer is None or self._batch_buffer.shape[1:] != item_shape:
+            self._batch_buffer = np.zeros((self.max_batch_size,) + item_shape, dtype=np.float32)
+        buffer = self._batch_buffer
+        accepted = []
+        for pending in batch:
+            try:
+                if np.shape(pending.data) != item_shape:
+                    raise ValueError(f'Expected input shape {item_shape}, got {np.shape(pending.data)}')
+                buffer[len(accepted)] = pending.data
+            except Exception as e:
+                pending.future.set_exception(e)
+            else:
+                accepted.append(pending)
+        batch = accepted
+        size = len(batch)
+        if not size:
+            return
+        inputs = buffer[:self._padded_size(size)]
+
+        try:
+            results = self.handler.predict_preprocessed(inputs)[:size]
+        except Exception as e:
+            for pending in batch:
+                pending.future.set_exception(e)
+            return
+
+        done = time.perf_counter()
+        self.batches += 1
+        self.frames += size
+        for pending, result in zip(batch, results):
+            result['camera_id'] = pending.camera_id
+            result['frame_number'] = pending.frame_number
+            result['batch_size'] = size
+            self._latencies.append(done - pending.enqueued_at)
+            pending.future.set_result(result)
+
+    def stats(self) -> Dict:
+        """처리량/배치 크기/대기열 지연 통계"""
+        latencies = np.array(list(self._latencies)) * 1000
+        percentiles = np.percentile(latencies, (50, 99)) if len(latencies) else (0.0, 0.0)
+        return {
+            'cameras': len(self._camera_locks),
+            'max_cameras': self.max_cameras,
+            'evicted_cameras': self.evicted_cameras,
+            'queue_depth': self._queue.qsize(),
+            'max_batch_size': self.max_batch_size,
+            'max_wait_ms': self.max_wait * 1000,
+            'batches': self.batches,
+            'frames': self.frames,
+            'rejected': self.rejected,
+            'avg_batch_size': round(self.frames / self.batches, 2) if self.batches else 0.0,
+            'p50_latency_ms': round(float(percentiles[0]), 2),
+            'p99_latency_ms': round(float(percentiles[1]), 2),
+        }
+
+
+# 결과를 기다리는 최대 시간 (초)
+FRAME_TIMEOUT = float(os.environ.get('FRAME_TIMEOUT', '5'))
+
+SERVER = InferenceServer(
+    ModelHandler(),
+    max_batch_size=int(os.environ.get('MAX_BATCH_SIZE', '16')),
+    max_wait=float(os.environ.get('MAX_BATCH_WAIT_MS', '10')) / 1000,
+    max_queue=int(os.environ.get('MAX_QUEUE', '256')),
+    max_cameras=int(os.environ.get('MAX_CAMERAS', '64')),
+    camera_idle_timeout=float(os.environ.get('CAMERA_IDLE_TIMEOUT', '300'))
+)
+
+
+def decode_frame(encoded: str) -> Optional[np.ndarray]:
+    """base64 이미지(JPEG/PNG, data URL 허용)를 BGR 프레임으로 변환 (실패하면 None)"""
+    if ',' in encoded and encoded.startswith('data:'):
+        encoded = encoded.split(',', 1)[1]
+    try:
+        data = base64.b64decode(encoded, validate=True)
+    except (binascii.Error, ValueError):
+        return None
+    return cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_COLOR)
+
+
+def create_app() -> Flask:
+    """추론 API 앱 생성 (스케줄러 스레드 시작)"""
+    app = Flask(__name__)
+    CORS(app)
+    SERVER.start()
+
+    @app.route('/api/analyze-frame', methods=['POST'])
+    def analyze_frame():
+        """카메라 프레임 하나 분석 (여러 카메라 요청을 묶어서 추론)"""
+        payload = request.get_json(silent=True)
+        if not isinstance(payload, dict) or not isinstance(payload.get('frame'), str):
+            return jsonify({
+                'error': 'Invalid request body',
+                'message': 'Please send a JSON object with a base64 "frame" and a "camera_id"'
+            }), 400
+
+        camera_id = payload.get('camera_id', 'camera_1')
+        if not isinstance(camera_id, str) or not camera_id:
+            return jsonify({
+                'error': 'Invalid camera_id',
+                'message': '"camera_id" must be a non-empty string'
+            }), 400
+
+        frame = decode_frame(payload['frame'])
+        if frame is None:
+            return jsonify({
+                'error': 'Invalid frame',
+                'message': '"frame" must be a base64-encoded JPEG or PNG image'
+            }), 400
+
+        try:
+            result = SERVER.analyze(frame, camera_id, FRAME_TIMEOUT)
+        except (QueueFull, TooManyCameras) as e:
+            return jsonify({'error': 'Server busy', 'message': str(e)}), 503
+        except futures.TimeoutError:
+            return jsonify({
+                'error': 'Inference timeout',
+                'message': f'No result within {FRAME_TIMEOUT} seconds'
+            }), 504
+
+        if result is None:
+            # 클립 모델: 다음 클립을 추론할 차례가 될 때까지 프레임을 모으는 중
+            return jsonify({'status': 'buffering', 'camera_id': camera_id}), 202
+        return jsonify({'status': 'analyzed', 'result': result})
+
+    @app.route('/api/inference/stats', methods=['GET'])
+    def inference_stats():
+        """마이크로 배치 처리량/지연 시간 통계"""
+        return jsonify(SERVER.stats())
+
+    return app
+
+
+if __name__ == '__main__':
+    port = int(os.environ.get('PORT', '5000'))
+    print("=" * 60)
+    print("🎥 멀티 카메라 추론 서버")
+    print("=" * 60)
+    print(f"📍 Server: http://localhost:{port}")
+    print(f"📦 Micro-batch: max {SERVER.max_batch_size} frames / {SERVER.max_wait * 1000:.0f} ms")
+    print("=" * 60)
+    create_app().run(host='0.0.0.0', port=port, threaded=True)
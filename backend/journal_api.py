@@ -0,0 +1,530 @@
+"""
+저널 API 공통 모듈
+
+로컬 서버(backend/app.py, asgi.py)와 Vercel 함수(api/index.py)가 같은 카탈로그,
+인덱스, 캐시와 라우트를 쓰도록 Blueprint와 create_app()을 제공한다.
+"""
+
+from flask import Blueprint, Flask, Response, g, jsonify, make_response, request
+from flask_cors import CORS
+import base64
+import binascii
+import functools
+import hmac
+import itertools
+import json
+import math
+import os
+from time import perf_counter
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+from catalog_loader import CatalogStore
+from fuzzy_search import tokenize
+from json_codec import BACKEND, dumps, encode_object
+from journal_catalog import JournalCatalog, normalize_string
+from request_metrics import RequestMetrics
+from response_cache import ResponseCache
+from suggest_trie import DEFAULT_TOP_K
+
+api = Blueprint('journal_api', __name__)
+
+# 저널 카탈로그는 data/journals.db(또는 인덱스 스냅샷)에서 처음 사용할 때 한 번만 읽는다
+# 요청마다 current_catalog()로 한 번만 읽어서, 교체 중에도 같은 스냅샷으로 끝까지 처리한다
+STORE = CatalogStore(lazy=True)
+
+# 관리자 API 토큰 (설정하지 않으면 관리자 API 비활성화)
+ADMIN_TOKEN = os.environ.get('ADMIN_TOKEN', '')
+
+# 0보다 크면 카탈로그 파일과 다시 읽기 트리거 파일을 주기적으로 확인해서 바뀌면 다시 읽음 (초)
+# gunicorn 워커는 이 값이 0이어도 관리자 API의 다시 읽기를 받도록 감시한다 (gunicorn.conf.py)
+CATALOG_WATCH_INTERVAL = float(os.environ.get('CATALOG_WATCH_INTERVAL', '0'))
+
+# 검색/목록 응답 캐시 (RESPONSE_CACHE_SIZE=0이면 비활성화)
+# 워커마다 본문 합계 RESPONSE_CACHE_MAX_BYTES까지 보관하고, 그 1/16보다 큰 본문(필터만 준 전체 목록 등)은 저장하지 않는다
+RESPONSE_CACHE = ResponseCache(
+    max_entries=int(os.environ.get('RESPONSE_CACHE_SIZE', '1024')),
+    ttl=float(os.environ.get('RESPONSE_CACHE_TTL', '300')),
+    max_bytes=int(os.environ.get('RESPONSE_CACHE_MAX_BYTES', str(64 * 1024 * 1024)))
+)
+
+# 라우트별 요청 수/지연 시간/응답 크기와 검색 단계 시간 (/metrics)
+METRICS = RequestMetrics()
+
+# 조회 응답의 캐시 시간 (초, 브라우저 / CDN)
+# 카탈로그는 드물게 바뀌고, 바뀌면 ETag가 달라지므로 만료 후 재검증에서 새 본문을 받는다
+CACHE_MAX_AGE = int(os.environ.get('CACHE_MAX_AGE', '300'))
+CDN_CACHE_MAX_AGE = int(os.environ.get('CDN_CACHE_MAX_AGE', '3600'))
+CACHE_CONTROL = f'public, max-age={CACHE_MAX_AGE}, s-maxage={CDN_CACHE_MAX_AGE}'
+
+# 응답 형식 버전 (응답 JSON 구조가 바뀌면 올려서 이전 ETag를 무효화)
+RESPONSE_FORMAT = 1
+
+
+def json_response(body: bytes, status: int = 200) -> Response:
+    """직렬화된 JSON 본문으로 응답 생성"""
+    return Response(body, status=status, mimetype='application/json')
+
+
+def with_query(query: str, body: bytes) -> bytes:
+    """캐시된 JSON 객체 본문 앞에 사용자가 입력한 query 필드를 붙임"""
+    return b'{"query":' + dumps(query) + b',' + body[1:]
+
+
+def current_catalog() -> JournalCatalog:
+    """이 요청에서 사용할 카탈로그 스냅샷 (ETag를 계산한 스냅샷과 같음)"""
+    catalog = g.get('catalog')
+    if catalog is None:
+        catalog = g.catalog = STORE.current
+    return catalog
+
+
+def catalog_etag(catalog: JournalCatalog) -> str:
+    """카탈로그 내용 해시로 정한 강한 ETag 값 (같은 URL이면 같은 본문)"""
+    # 직렬화 모듈에 따라 본문 바이트가 조금 다를 수 있으므로 함께 넣는다
+    return f'{catalog.content_hash}-{BACKEND}-{RESPONSE_FORMAT}'
+
+
+def conditional(view: Callable) -> Callable:
+    """
+    조회 라우트에 ETag/Cache-Control을 붙이는 데코레이터
+
+    If-None-Match가 현재 ETag와 맞으면 파라미터 검사, 필터링, 직렬화 없이 바로 304를 응답한다.
+    """
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        etag = catalog_etag(current_catalog())
+        if request.if_none_match.contains_weak(etag):
+            response = Response(status=304)
+        else:
+            response = make_response(view(*args, **kwargs))
+            # 오류 응답은 캐시하지 않는다
+            if response.status_code != 200:
+                return response
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = CACHE_CONTROL
+        return response
+    return wrapper
+
+
+@api.before_app_request
+def start_timer():
+    g.request_started = perf_counter()
+
+
+@api.after_app_request
+def record_request(response: Response) -> Response:
+    """라우트별 지연 시간/응답 크기 기록 (라우트 패턴 단위로 모아서 레이블 수가 늘지 않음)"""
+    started = g.get('request_started')
+    if started is not None:
+        rule = request.url_rule
+        METRICS.observe_request(
+            rule.rule if rule is not None else 'unmatched',
+            request.method,
+            response.status_code,
+            perf_counter() - started,
+            None if response.is_streamed else response.content_length
+        )
+    return response
+
+
+@api.route('/')
+@api.route('/api')
+@conditional
+def home():
+    """API 정보"""
+    return jsonify({
+        'message': 'Journal Impact Factor API',
+        'version': '1.0.0',
+        'endpoints': {
+            '/api/search': 'Search journals by name or ISSN (mode=fuzzy, limit, offset)',
+            '/api/suggest': 'Autocomplete journal names/ISSNs by prefix',
+            '/api/journals': 'Get all journals (category, categories, quartile, min_if, max_if, limit, cursor, format=ndjson)',
+            '/api/stats': 'Get database statistics',
+            '/api/journal/<issn>': 'Get a journal by ISSN',
+            '/api/journals/batch': 'Resolve many ISSNs/names in one request (POST)',
+            '/metrics': 'Request/search/cache metrics in Prometheus text format'
+        }
+    })
+
+
+# 검색 결과 페이지 크기 (퍼지 검색 기본값 / 최대값)
+DEFAULT_SEARCH_LIMIT = 20
+MAX_SEARCH_LIMIT = 100
+
+
+def int_arg(name: str, default: Optional[int], minimum: int, maximum: Optional[int] = None) -> Optional[int]:
+    """정수 쿼리 파라미터 (범위를 벗어나거나 숫자가 아니면 ValueError)"""
+    raw = request.args.get(name, '').strip()
+    if not raw:
+        return default
+    value = int(raw)
+    if value < minimum or (maximum is not None and value > maximum):
+        raise ValueError(f'{name} out of range')
+    return value
+
+
+def float_arg(name: str) -> Optional[float]:
+    """실수 쿼리 파라미터 (없으면 None, 숫자가 아니면 ValueError)"""
+    raw = request.args.get(name, '').strip()
+    if not raw:
+        return None
+    value = float(raw)
+    if not math.isfinite(value):
+        raise ValueError(f'{name} must be finite')
+    return value
+
+
+@api.route('/api/search', methods=['GET'])
+@conditional
+def search():
+    """저널 검색 API (mode=fuzzy: 오타/약어 허용 순위 검색)"""
+    query = request.args.get('q', '').strip()
+    mode = request.args.get('mode', 'exact').strip().lower()
+    
+    if not query:
+        return jsonify({
+            'error': 'Search query is required',
+            'message': 'Please provide a search query using ?q=parameter'
+        }), 400
+    
+    if mode not in ('exact', 'fuzzy'):
+        return jsonify({
+            'error': 'Invalid search mode',
+            'message': 'mode must be "exact" or "fuzzy"'
+        }), 400
+    
+    try:
+        default_limit = DEFAULT_SEARCH_LIMIT if mode == 'fuzzy' else None
+        limit = int_arg('limit', default_limit, 1, MAX_SEARCH_LIMIT)
+        offset = int_arg('offset', 0, 0)
+    except ValueError:
+        return jsonify({
+            'error': 'Invalid pagination parameters',
+            'message': f'limit must be 1-{MAX_SEARCH_LIMIT} and offset must be >= 0'
+        }), 400
+    
+    catalog = current_catalog()
+    # 결과는 정규화된 질의로만 결정되므로 캐시 키도 정규화된 값을 사용
+    normalized = normalize_string(query)
+    if mode == 'fuzzy':
+        normalized = (normalized, ' '.join(tokenize(query)))
+    cache_key = ('search', mode, normalized, limit, offset)
+    body = RESPONSE_CACHE.get(catalog.version, cache_key)
+    if body is not None:
+        return json_response(with_query(query, body))
+    
+    # 결과 저널은 카탈로그에 미리 직렬화된 행 JSON을 이어 붙여 만든다
+    if mode == 'fuzzy':
+        scored, has_more = catalog.fuzzy_search_rows(query, limit, offset, METRICS.phase_observer('fuzzy'))
+        response = {
+            'mode': mode,
+            'offset': offset,
+            'limit': limit,
+            'count': len(scored),
+            'has_more': has_more,
+            'results': catalog.encode_scored(scored)
+        }
+    else:
+        rows = catalog.search_rows(query, METRICS.phase_observer('exact'))
+        response = {
+            'count': len(rows)
+        }
+        if limit is not None or offset:
+            # 정확 검색의 count는 기존처럼 전체 일치 개수
+            end = None if limit is None else offset + limit
+            response.update(offset=offset, limit=limit)
+            rows = rows[offset:end]
+        response['results'] = catalog.encode_rows(rows)
+    
+    body = encode_object(response)
+    RESPONSE_CACHE.set(catalog.version, cache_key, body)
+    return json_response(with_query(query, body))
+
+
+# 자동완성 제안 수 (트라이 노드에 저장된 상위 k개가 최대)
+DEFAULT_SUGGEST_LIMIT = DEFAULT_TOP_K
+
+# 목록 페이지 크기 (커서만 주어졌을 때 기본값 / 최대값)
+DEFAULT_PAGE_LIMIT = 100
+MAX_PAGE_LIMIT = 1000
+
+
+def encode_cursor(journal: Dict) -> str:
+    """다음 페이지 커서 (마지막 저널의 Impact Factor + ISSN)"""
+    raw = json.dumps([journal['impact_factor'], journal['issn']], separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Tuple[float, str]:
+    """커서 문자열 해석 (형식이 잘못되면 ValueError)"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        impact_factor, issn = json.loads(raw)
+    except (binascii.Error, TypeError, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError('invalid cursor') from e
+    if not isinstance(impact_factor, (int, float)) or not isinstance(issn, str):
+        raise ValueError('invalid cursor')
+    return float(impact_factor), issn
+
+
+def stream_ndjson(fragments: Iterator[bytes]) -> Iterator[bytes]:
+    """직렬화된 저널을 한 줄에 하나씩 내보내는 제너레이터"""
+    for fragment in fragments:
+        yield fragment + b'\n'
+
+
+@api.route('/api/suggest', methods=['GET'])
+@conditional
+def suggest():
+    """검색창 자동완성 (이름/ISSN 접두어, Impact Factor 상위 순)"""
+    prefix = request.args.get('prefix', '').strip()
+    
+    if not normalize_string(prefix):
+        return jsonify({
+            'error': 'Prefix is required',
+            'message': 'Please provide a prefix using ?prefix=parameter'
+        }), 400
+    
+    try:
+        limit = int_arg('limit', DEFAULT_SUGGEST_LIMIT, 1, DEFAULT_SUGGEST_LIMIT)
+    except ValueError:
+        return jsonify({
+            'error': 'Invalid limit',
+            'message': f'limit must be 1-{DEFAULT_SUGGEST_LIMIT}'
+        }), 400
+    
+    catalog = current_catalog()
+    rows = catalog.suggest_rows(prefix, limit)
+    return json_response(encode_object({
+        'prefix': prefix,
+        'count': len(rows),
+        'suggestions': catalog.encode_rows(rows)
+    }))
+
+
+@api.route('/api/journals', methods=['GET'])
+@conditional
+def get_all_journals():
+    """전체 저널 목록 조회 (필터, limit/cursor 페이지네이션, format=ndjson 스트리밍)"""
+    # 카테고리 부분 문자열 필터
+    category = request.args.get('category', '').strip()
+    # 정확한 카테고리 이름 (여러 번 지정 가능, 이름에 쉼표가 들어갈 수 있어 나누지 않음)
+    categories = sorted({value.strip().lower() for value in request.args.getlist('categories') if value.strip()})
+    # 분위 (quartile=Q1,Q2 또는 quartile=Q1&quartile=Q2)
+    quartiles = sorted({
+        part.strip().upper()
+        for value in request.args.getlist('quartile')
+        for part in value.split(',')
+        if part.strip()
+    })
+    cursor = request.args.get('cursor', '').strip()
+    output_format = request.args.get('format', 'json').strip().lower()
+    
+    if output_format not in ('json', 'ndjson'):
+        return jsonify({
+            'error': 'Invalid format',
+            'message': 'format must be "json" or "ndjson"'
+        }), 400
+    
+    try:
+        after = decode_cursor(cursor) if cursor else None
+        limit = int_arg('limit', DEFAULT_PAGE_LIMIT if cursor else None, 1, MAX_PAGE_LIMIT)
+    except ValueError:
+        return jsonify({
+            'error': 'Invalid pagination parameters',
+            'message': f'limit must be 1-{MAX_PAGE_LIMIT} and cursor must come from next_cursor'
+        }), 400
+    
+    try:
+        min_if = float_arg('min_if')
+        max_if = float_arg('max_if')
+    except ValueError:
+        return jsonify({
+            'error': 'Invalid filter parameters',
+            'message': 'min_if and max_if must be numbers'
+        }), 400
+    
+    catalog = current_catalog()
+    filtered = bool(categories or quartiles) or min_if is not None or max_if is not None
+    
+    def select_rows(count: Optional[int]) -> Iterable[int]:
+        """정렬 순서대로 조건에 맞는 행 번호 (count개까지)"""
+        if not filtered:
+            rows = catalog.iter_rows(category, after)
+            return rows if count is None else itertools.islice(rows, count)
+        # 범위/분위/카테고리 조건은 NumPy 마스크로 한 번에 계산
+        rows = catalog.filter_rows(category, categories, quartiles, min_if, max_if, after)
+        return (rows if count is None else rows[:count]).tolist()
+    
+    if output_format == 'ndjson':
+        # 한 줄씩 만들어 보내므로 카탈로그 크기와 관계없이 요청당 메모리가 일정하다
+        rows = select_rows(limit)
+        return Response(stream_ndjson(map(catalog.row_json.__getitem__, rows)), mimetype='application/x-ndjson')
+    
+    cache_key = ('journals', category.lower(), tuple(categories), tuple(quartiles), min_if, max_if, limit, after)
+    body = RESPONSE_CACHE.get(catalog.version, cache_key)
+    if body is None:
+        if limit is None:
+            rows = list(select_rows(None))
+            response = {
+                'count': len(rows),
+                'journals': catalog.encode_rows(rows)
+            }
+        else:
+            # 다음 페이지 존재 여부를 알기 위해 하나 더 읽는다
+            rows = list(select_rows(limit + 1))
+            has_more = len(rows) > limit
+            rows = rows[:limit]
+            response = {
+                'count': len(rows),
+                'limit': limit,
+                'journals': catalog.encode_rows(rows),
+                'next_cursor': encode_cursor(catalog.records.get(rows[-1])) if has_more else None
+            }
+        body = encode_object(response)
+        RESPONSE_CACHE.set(catalog.version, cache_key, body)
+    
+    return json_response(body)
+
+
+# 직렬화된 통계 응답 (카탈로그 버전, 본문)
+_stats_response = (None, None)
+
+
+@api.route('/api/stats', methods=['GET'])
+@conditional
+def get_stats():
+    """데이터베이스 통계"""
+    global _stats_response
+    catalog = current_catalog()
+    version, body = _stats_response
+    if version != catalog.version:
+        # 카탈로그가 바뀐 경우에만 응답 본문을 다시 만든다
+        version = catalog.version
+        body = dumps(catalog.stats())
+        _stats_response = (version, body)
+    
+    return json_response(body)
+
+
+@api.route('/api/journal/<path:issn>', methods=['GET'])
+@conditional
+def get_journal_by_issn(issn: str):
+    """ISSN으로 특정 저널 조회"""
+    body = current_catalog().get_json_by_issn(issn)
+    if body is not None:
+        return json_response(body)
+    
+    return jsonify({
+        'error': 'Journal not found',
+        'message': f'No journal found with ISSN: {issn}'
+    }), 404
+
+
+# 배치 조회 한 번에 받을 수 있는 최대 항목 수
+MAX_BATCH_ITEMS = 1000
+
+
+def resolve_journal(catalog: JournalCatalog, query: str, kind: str) -> Optional[Dict]:
+    """ISSN 또는 저널 이름 하나를 조회 (kind: 'issn', 'name', 'auto')"""
+    if kind in ('issn', 'auto'):
+        journal = catalog.get_by_issn(query)
+        if journal is not None or kind == 'issn':
+            return journal
+    return catalog.get_by_name(query)
+
+
+@api.route('/api/journals/batch', methods=['POST'])
+def get_journals_batch():
+    """여러 ISSN/저널 이름을 한 번에 조회"""
+    payload = request.get_json(silent=True)
+    if not isinstance(payload, dict):
+        return jsonify({
+            'error': 'Invalid request body',
+            'message': 'Please send a JSON object with "issns", "names" or "queries" lists'
+        }), 400
+    
+    # issns: ISSN만, names: 이름만, queries: ISSN을 먼저 찾고 없으면 이름으로 조회
+    items = []
+    for field, kind in (('issns', 'issn'), ('names', 'name'), ('queries', 'auto')):
+        values = payload.get(field, [])
+        if not isinstance(values, list) or not all(isinstance(v, str) for v in values):
+            return jsonify({
+                'error': 'Invalid request body',
+                'message': f'"{field}" must be a list of strings'
+            }), 400
+        items.extend((value, kind) for value in values)
+    
+    if not items:
+        return jsonify({
+            'error': 'No items to resolve',
+            'message': 'Please provide at least one ISSN or journal name'
+        }), 400
+    if len(items) > MAX_BATCH_ITEMS:
+        return jsonify({
+            'error': 'Too many items',
+            'message': f'A batch may contain at most {MAX_BATCH_ITEMS} items'
+        }), 400
+    
+    catalog = current_catalog()
+    results = []
+    misses = []
+    for query, kind in items:
+        journal = resolve_journal(catalog, query, kind)
+        results.append({'query': query, 'type': kind, 'found': journal is not None, 'journal': journal})
+        if journal is None:
+            misses.append(query)
+    
+    return json_response(dumps({
+        'count': len(items),
+        'found': len(items) - len(misses),
+        'results': results,
+        'misses': misses
+    }))
+
+
+@api.route('/api/cache/stats', methods=['GET'])
+def get_cache_stats():
+    """응답 캐시 적중/실패/제거 카운터"""
+    return jsonify(RESPONSE_CACHE.stats())
+
+
+@api.route('/metrics', methods=['GET'])
+def get_metrics():
+    """Prometheus 텍스트 형식 지표 (이 프로세스에서 처리한 요청 기준)"""
+    return Response(METRICS.render(RESPONSE_CACHE.stats()), mimetype='text/plain; version=0.0.4')
+
+
+@api.route('/api/admin/reload', methods=['POST'])
+def reload_catalog():
+    """
+    카탈로그 파일을 백그라운드에서 다시 읽고 교체
+
+    이 워커는 바로 다시 읽고, 같은 카탈로그를 쓰는 다른 워커들은 트리거 파일을 보고 다시 읽는다.
+    """
+    # 토큰 비교 시간으로 일치하는 앞부분 길이를 알 수 없도록 상수 시간 비교
+    token = request.headers.get('X-Admin-Token', '').encode('utf-8')
+    if not ADMIN_TOKEN or not hmac.compare_digest(token, ADMIN_TOKEN.encode('utf-8')):
+        return jsonify({
+            'error': 'Forbidden',
+            'message': 'A valid X-Admin-Token header is required'
+        }), 403
+    
+    # 트리거를 먼저 갱신해야 이 워커가 다시 읽은 뒤 감시 스레드가 한 번 더 읽지 않는다
+    notified = STORE.notify_workers()
+    started = STORE.reload_async()
+    return jsonify({
+        'status': 'reloading' if started else 'already_reloading',
+        'workers_notified': notified,
+        'catalog': STORE.status()
+    }), 202 if started else 409
+
+
+def create_app() -> Flask:
+    """저널 API 라우트를 등록한 Flask 앱 생성"""
+    app = Flask(__name__)
+    CORS(app)
+    app.register_blueprint(api)
+    if CATALOG_WATCH_INTERVAL > 0:
+        STORE.watch(CATALOG_WATCH_INTERVAL)
+    return app
@@ -0,0 +1,554 @@
+"""
+저널 카탈로그 인덱스
+
+카탈로그를 로드할 때 한 번만 정규화와 인덱싱을 수행해서
+검색 요청마다 전체 저널을 다시 정규화하지 않도록 한다.
+카탈로그는 만든 뒤 바뀌지 않는다. 내용이 바뀌면 CatalogStore가 새 카탈로그를 만들어
+참조를 교체하므로, 요청 스레드는 잠금 없이 인덱스를 읽는다.
+
+NumPy는 필터/통계(category_distribution)와 여러 단어 퍼지 검색에만 필요하므로
+처음 사용할 때 가져온다. 스냅샷에서 읽은 카탈로그는 NumPy 없이 정확 검색/목록 응답을 만든다.
+
+숫자/코드 열(Impact Factor, 카테고리/분위 코드, 상위 백분율, 정렬 순서와 정렬된 필터용 열)은
+use_columns()로 메모리 매핑된 열 파일의 버퍼로 바꿀 수 있다. 페이지 캐시를 그대로 읽으므로
+같은 파일을 연 워커 프로세스들이 이 열들을 한 벌만 공유한다.
+"""
+
+import bisect
+import hashlib
+import heapq
+import itertools
+import threading
+from array import array
+from collections import defaultdict
+from time import perf_counter
+from typing import TYPE_CHECKING, Callable, Collection, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from fuzzy_search import FuzzyIndex
+from journal_records import Column, JournalRecords, to_array
+from json_codec import RawJSON, dumps, encode_array
+from suggest_trie import SuggestTrie
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from category_distribution import Distribution, SortedColumns
+
+# 부분 문자열 검색에 사용하는 n-gram 길이
+NGRAM_SIZE = 3
+
+# 검색 단계별 소요 시간을 받는 함수 (단계 이름, 초)
+PhaseObserver = Callable[[str, float], None]
+
+# 카탈로그 버전 번호 (프로세스 안에서 카탈로그 인스턴스가 바뀌어도 겹치지 않음)
+_versions = itertools.count(1)
+
+def normalize_string(s: str) -> str:
+    """문자열을 검색용으로 정규화"""
+    return s.lower().strip().replace('-', '').replace(' ', '')
+
+
+def ngrams(s: str, n: int = NGRAM_SIZE) -> set:
+    """문자열의 n-gram 집합"""
+    return {s[i:i + n] for i in range(len(s) - n + 1)}
+
+
+class CategoryStats:
+    """카테고리별 Impact Factor 누적 통계"""
+
+    __slots__ = ('count', 'total', 'min', 'max', 'rows')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+        self.rows: List[int] = []
+
+    def add(self, row: int, impact_factor: float):
+        self.count += 1
+        self.total += impact_factor
+        self.min = impact_factor if self.min is None else min(self.min, impact_factor)
+        self.max = impact_factor if self.max is None else max(self.max, impact_factor)
+        self.rows.append(row)
+
+    @property
+    def average(self) -> float:
+        return round(self.total / self.count, 2) if self.count else 0
+
+
+class JournalCatalog:
+    """정규화된 이름/ISSN과 trigram 역색인을 가진 저널 카탈로그"""
+
+    def __init__(self, journals: Iterable[Dict]):
+        # 저널은 dict가 아니라 필드별 배열로 보관하고, 응답을 만들 때만 dict로 바꾼다
+        self.records = JournalRecords()
+        self.normalized_names: List[str] = []
+        self.normalized_issns: List[str] = []
+        # 행별로 미리 직렬화한 JSON (목록 응답은 이 조각들을 이어 붙여 만든다)
+        self.row_json: List[bytes] = []
+        self.trigram_index: Dict[str, array] = {}
+        self.issn_index: Dict[str, int] = {}
+        self.name_index: Dict[str, int] = {}
+        self.sorted_rows: Column = array('I')
+        self.category_rows: Dict[str, List[int]] = {}
+        self.category_keys: List[str] = []
+        self.category_stats: Dict[str, CategoryStats] = {}
+        self.total_impact_factor = 0.0
+        # 인스턴스마다 다른 버전 (응답 캐시/ETag 무효화에 사용)
+        self.version = next(_versions)
+        self._stats_cache = None
+        # (버전, 내용 해시) - 스냅샷에 함께 저장해서 콜드 스타트에 다시 계산하지 않는다
+        self._content_hash: Optional[Tuple[int, str]] = None
+        self._fuzzy_index: Optional[FuzzyIndex] = None
+        self._suggest_trie: Optional[SuggestTrie] = None
+        # 행별 카테고리 내 상위 백분율 (행 JSON에 들어가므로 스냅샷에도 저장)
+        self.top_percents: Column = array('d')
+        # 메모리 매핑된 열 파일의 버퍼 (use_columns, 정렬된 필터용 열을 여기서 복사 없이 만든다)
+        self._column_buffers: Optional[Dict[str, memoryview]] = None
+        # NumPy 열 배열과 분포 (스냅샷에서 읽은 카탈로그는 다음 필터/통계 요청 때 한 번만 만든다)
+        self._columns: Optional['SortedColumns'] = None
+        self._distribution: Optional['Distribution'] = None
+        # 지연 생성을 직렬화 (동시에 들어온 첫 요청들이 같은 인덱스를 각자 만들지 않게)
+        self._lock = threading.Lock()
+
+        for journal in journals:
+            self._append(journal)
+        self._build_indexes()
+
+    def __len__(self):
+        return len(self.records)
+
+    def __getstate__(self) -> Dict:
+        """스냅샷(pickle)에는 레코드, 행 JSON과 기본 인덱스만 저장"""
+        state = self.__dict__.copy()
+        # 퍼지 인덱스/트라이는 작은 객체가 많아 pickle에서 읽는 것이 오래 걸리고,
+        # NumPy 열과 분포는 필요할 때 금방 다시 만들 수 있으므로 처음 사용할 때 만든다
+        for name in ('_lock', '_stats_cache', '_fuzzy_index', '_suggest_trie', '_columns', '_distribution',
+                     '_column_buffers'):
+            state[name] = None
+        state['sorted_rows'] = to_array(self.sorted_rows)
+        state['top_percents'] = to_array(self.top_percents)
+        return state
+
+    def __setstate__(self, state: Dict):
+        self.__dict__.update(state)
+        self.version = next(_versions)
+        self._lock = threading.Lock()
+        if self._content_hash is not None and self._content_hash[0] == state['version']:
+            self._content_hash = (self.version, self._content_hash[1])
+
+    def _sort_key(self, row: int):
+        """Impact Factor 내림차순, 동점이면 ISSN 순서 (커서 페이지네이션 기준)"""
+        return -self.records.impact_factors[row], self.records.issns[row], row
+
+    def _cursor_key(self, row: int):
+        return -self.records.impact_factors[row], self.records.issns[row]
+
+    def _append(self, journal: Dict) -> int:
+        row = self.records.append(journal)
+        self.normalized_names.append(normalize_string(journal['name']))
+        self.normalized_issns.append(normalize_string(journal['issn']))
+        self._stats_for(journal['category']).add(row, journal['impact_factor'])
+        self.total_impact_factor += journal['impact_factor']
+        return row
+
+    def _stats_for(self, category: str) -> CategoryStats:
+        if category not in self.category_stats:
+            self.category_stats[category] = CategoryStats()
+        return self.category_stats[category]
+
+    def _row_grams(self, row: int) -> set:
+        return ngrams(self.normalized_names[row]) | ngrams(self.normalized_issns[row])
+
+    def _row_issns(self, row: int) -> List[str]:
+        """행의 정규화된 ISSN 목록 (인쇄판, 전자판, ISSN-L 중 있는 필드만)"""
+        records = self.records
+        issns = (records.issns[row], records.eissns[row], records.issn_ls[row])
+        return [normalize_string(issn) for issn in issns if issn]
+
+    def _build_indexes(self):
+        """trigram 역색인, ISSN 조회 테이블과 정렬된 뷰를 한 번에 생성"""
+        postings = defaultdict(list)
+        for row in range(len(self.records)):
+            for gram in self._row_grams(row):
+                postings[gram].append(row)
+            for issn in self._row_issns(row):
+                # 같은 ISSN이 여러 번 나오면 기존처럼 첫 번째 저널을 돌려준다
+                self.issn_index.setdefault(issn, row)
+            self.name_index.setdefault(self.normalized_names[row], row)
+        # 행 번호는 4바이트 배열로 보관해서 메모리를 줄인다
+        self.trigram_index = {gram: array('I', rows) for gram, rows in postings.items()}
+
+        self.sorted_rows = array('I', sorted(range(len(self.records)), key=self._sort_key))
+        category_rows = defaultdict(list)
+        for row in self.sorted_rows:
+            category_rows[self.records.category(row).lower()].append(row)
+        self.category_rows = dict(category_rows)
+        self.category_keys = sorted(self.category_rows)
+        self._fuzzy_index = self._build_fuzzy_index()
+        self._suggest_trie = self._build_suggest_trie()
+        self._build_columns()
+        self.top_percents = array('d', self._distribution.top_percents.tobytes())
+        self.row_json = [dumps(self._journal(row)) for row in range(len(self.records))]
+
+    def _build_columns(self) -> 'SortedColumns':
+        """정렬된 NumPy 열 배열과 카테고리 분포 생성"""
+        from category_distribution import Distribution, SortedColumns
+
+        buffers = self._column_buffers
+        if buffers is not None:
+            columns = SortedColumns.from_buffers(buffers['sorted_rows'], buffers['sorted_impact_factors'],
+                                                 buffers['sorted_category_codes'], buffers['sorted_quartile_codes'])
+        else:
+            columns = SortedColumns.from_records(self.records, self.sorted_rows)
+        self._distribution = Distribution(columns.rows, columns.impact_factors, columns.category_codes,
+                                          len(self.records.categories.values))
+        self._columns = columns
+        return columns
+
+    def column_buffers(self) -> Dict:
+        """열 파일에 저장할 숫자/코드 열 (이름 -> 버퍼 프로토콜을 지원하는 배열)"""
+        columns = self._sorted_columns()
+        records = self.records
+        return {
+            'impact_factors': records.impact_factors,
+            'category_codes': records.category_codes,
+            'quartile_codes': records.quartile_codes,
+            'top_percents': self.top_percents,
+            'sorted_rows': self.sorted_rows,
+            'sorted_impact_factors': columns.impact_factors,
+            'sorted_category_codes': columns.category_codes,
+            'sorted_quartile_codes': columns.quartile_codes,
+        }
+
+    def use_columns(self, buffers: Dict[str, memoryview]):
+        """
+        숫자/코드 열을 메모리 매핑된 열 파일의 버퍼로 교체 (같은 카탈로그 파일로 만든 열 파일이어야 함)
+
+        값은 그대로이고 힙에 있던 배열만 버려진다. 새 카탈로그를 요청에 내놓기 전에 호출한다.
+        """
+        if len(buffers['impact_factors']) != len(self.records):
+            raise ValueError('column file does not match the catalogue')
+        records = self.records
+        records.impact_factors = buffers['impact_factors']
+        records.category_codes = buffers['category_codes']
+        records.quartile_codes = buffers['quartile_codes']
+        self.top_percents = buffers['top_percents']
+        self.sorted_rows = buffers['sorted_rows']
+        self._column_buffers = buffers
+        # 힙에서 만든 필터용 열은 버리고, 다음에 쓸 때 열 파일의 버퍼를 감싼다
+        self._columns = None
+        self._distribution = None
+
+    def _lazy_index(self, name: str, build: Callable[[], object]):
+        """지연 생성 속성 (없으면 잠금 안에서 한 번만 만든다)"""
+        index = getattr(self, name)
+        if index is None:
+            with self._lock:
+                index = getattr(self, name)
+                if index is None:
+                    index = build()
+                    setattr(self, name, index)
+        return index
+
+    def _sorted_columns(self) -> 'SortedColumns':
+        """열 배열 (스냅샷에서 읽은 카탈로그는 처음 사용할 때 만든다)"""
+        return self._lazy_index('_columns', self._build_columns)
+
+    def _category_distribution(self) -> 'Distribution':
+        distribution = self._distribution
+        if distribution is None:
+            with self._lock:
+                if self._distribution is None:
+                    self._build_columns()
+                distribution = self._distribution
+        return distribution
+
+    def _journal(self, row: int) -> Dict:
+        """행을 API 응답용 dict로 만듦 (카테고리 내 상위 백분율 포함)"""
+        journal = self.records.get(row)
+        journal['category_top_percent'] = self.top_percents[row]
+        return journal
+
+    def warm(self):
+        """
+        지연 생성하는 인덱스를 모두 미리 만듦
+
+        다시 읽은 카탈로그를 교체하기 전과 gunicorn 마스터에서 fork하기 전에 호출해서
+        요청 스레드가 인덱스를 만들지 않게 하고, 워커들이 마스터의 인덱스를 공유하게 한다.
+        """
+        self._sorted_columns()
+        self._category_distribution()
+        self._lazy_index('_fuzzy_index', self._build_fuzzy_index)
+        self._lazy_index('_suggest_trie', self._build_suggest_trie)
+        self.content_hash
+
+    def _build_fuzzy_index(self) -> FuzzyIndex:
+        return FuzzyIndex([self.records.names[row] for row in self.sorted_rows])
+
+    def _build_suggest_trie(self) -> SuggestTrie:
+        return SuggestTrie([[self.normalized_names[row], *self._row_issns(row)] for row in self.sorted_rows])
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    @property
+    def content_hash(self) -> str:
+        """행 JSON 전체의 해시 (프로세스/인스턴스가 달라도 내용이 같으면 같은 값, ETag에 사용)"""
+        cached = self._content_hash
+        version = self.version
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        # 다른 내용(통계, 정렬, 상위 백분율)은 모두 행에서 정해지므로 행만 해시한다
+        content_hash = hashlib.blake2b(b'\n'.join(self.row_json), digest_size=16).hexdigest()
+        self._content_hash = (version, content_hash)
+        return content_hash
+
+    def encode_rows(self, rows: Iterable[int]) -> RawJSON:
+        """행 목록을 미리 직렬화된 조각으로 JSON 배열 생성"""
+        return encode_array(map(self.row_json.__getitem__, rows))
+
+    def encode_scored(self, scored: Iterable[Tuple[int, float]]) -> RawJSON:
+        """(행, 점수) 목록을 score 필드가 붙은 JSON 배열로 생성"""
+        row_json = self.row_json
+        return encode_array(row_json[row][:-1] + b',"score":' + dumps(score) + b'}' for row, score in scored)
+
+    def get_by_issn(self, issn: str) -> Optional[Dict]:
+        """ISSN(인쇄판/전자판/ISSN-L)으로 저널 조회"""
+        row = self.issn_index.get(normalize_string(issn))
+        return None if row is None else self._journal(row)
+
+    def get_json_by_issn(self, issn: str) -> Optional[bytes]:
+        """ISSN으로 찾은 저널의 미리 직렬화된 JSON (/api/journal/<issn> 응답)"""
+        row = self.issn_index.get(normalize_string(issn))
+        return None if row is None else self.row_json[row]
+
+    def get_by_name(self, name: str) -> Optional[Dict]:
+        """정규화된 이름이 정확히 같은 저널 조회"""
+        row = self.name_index.get(normalize_string(name))
+        return None if row is None else self._journal(row)
+
+    def matching_categories(self, category: str) -> List[str]:
+        """부분 문자열로 일치하는 카테고리 키 목록"""
+        needle = category.lower()
+        return [key for key in self.category_keys if needle in key]
+
+    def iter_rows(self, category: str = '', after: Optional[Tuple[float, str]] = None) -> Iterator[int]:
+        """
+        Impact Factor 내림차순 행 번호 순회 (카테고리 부분 문자열 필터)
+
+        after: (impact_factor, issn) 커서. 주어지면 그 저널 다음부터 순회한다.
+        """
+        if not category:
+            row_lists = [self.sorted_rows]
+        else:
+            row_lists = [self.category_rows[key] for key in self.matching_categories(category)]
+
+        if after is not None:
+            # 각 정렬된 목록에서 커서 다음 위치를 이분 탐색 (앞부분은 건너뛰지 않고 바로 시작)
+            cursor = (-after[0], after[1])
+            row_lists = [
+                map(rows.__getitem__, range(bisect.bisect_right(rows, cursor, key=self._cursor_key), len(rows)))
+                for rows in row_lists
+            ]
+
+        return iter(row_lists[0]) if len(row_lists) == 1 else heapq.merge(*row_lists, key=self._sort_key)
+
+    def filter_rows(self, category: str = '', categories: Collection[str] = (), quartiles: Collection[str] = (),
+                    min_if: Optional[float] = None, max_if: Optional[float] = None,
+                    after: Optional[Tuple[float, str]] = None) -> 'np.ndarray':
+        """
+        여러 조건을 모두 만족하는 행 번호 배열 (iter_rows와 같은 정렬 순서)
+
+        category: 카테고리 부분 문자열, categories: 정확히 일치하는 카테고리 이름들,
+        quartiles: 분위(Q1~Q4)들, min_if/max_if: Impact Factor 범위 (양끝 포함)
+        """
+        import numpy as np
+
+        columns = self._sorted_columns()
+
+        # 커서 이전 부분은 마스크를 계산하지 않는다
+        start = 0
+        if after is not None:
+            start = bisect.bisect_right(self.sorted_rows, (-after[0], after[1]), key=self._cursor_key)
+        impact_factors = columns.impact_factors[start:]
+        conditions = []
+
+        # 카테고리/분위 조건은 값 테이블에서 허용 코드를 먼저 고른 뒤 코드 배열로 한 번에 조회
+        category_table = self.records.categories.values
+        if category:
+            needle = category.lower()
+            conditions.append(self._code_mask([needle in value.lower() for value in category_table],
+                                              columns.category_codes[start:]))
+        if categories:
+            wanted = {name.lower() for name in categories}
+            conditions.append(self._code_mask([value.lower() in wanted for value in category_table],
+                                              columns.category_codes[start:]))
+        if quartiles:
+            wanted = {quartile.upper() for quartile in quartiles}
+            conditions.append(self._code_mask([value.upper() in wanted for value in self.records.quartiles.values],
+                                              columns.quartile_codes[start:]))
+        if min_if is not None:
+            conditions.append(impact_factors >= min_if)
+        if max_if is not None:
+            conditions.append(impact_factors <= max_if)
+
+        rows = columns.rows[start:]
+        if not conditions:
+            return rows
+        mask = conditions[0]
+        for condition in conditions[1:]:
+            mask &= condition
+        # 불리언 인덱싱보다 compress가 흩어진 마스크에서 훨씬 빠르다
+        return np.compress(mask, rows)
+
+    @staticmethod
+    def _code_mask(allowed: List[bool], codes: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np
+
+        return np.take(np.array(allowed, dtype=bool), codes) if allowed else np.zeros(len(codes), dtype=bool)
+
+    def stats(self) -> Dict:
+        """누적 통계로 만든 /api/stats 응답 (버전별로 캐시)"""
+        cached = self._stats_cache
+        if cached is not None and cached[0] == self.version:
+            return cached[1]
+
+        version = self.version
+        names = self.records.names
+        impact_factors = self.records.impact_factors
+        sorted_rows = self.sorted_rows
+        total = len(self.records)
+        from category_distribution import histogram_labels, percentile_fields
+
+        distribution = self._category_distribution()
+        category_codes = self.records.categories.codes
+        summary = {
+            'total_journals': total,
+            'categories': len(self.category_stats),
+            'category_breakdown': {
+                category: {
+                    'count': cat.count,
+                    'avg_impact_factor': cat.average,
+                    'min_impact_factor': cat.min,
+                    'max_impact_factor': cat.max,
+                    **distribution.summary(category_codes[category]),
+                    'journals': [names[row] for row in cat.rows],
+                }
+                for category, cat in self.category_stats.items()
+            },
+            'impact_factor_stats': {
+                'min': impact_factors[sorted_rows[-1]] if total else 0,
+                'max': impact_factors[sorted_rows[0]] if total else 0,
+                'avg': round(self.total_impact_factor / total, 2) if total else 0,
+                **percentile_fields(distribution.overall_percentiles, distribution.overall_histogram, suffix=''),
+            },
+            'histogram_bins': histogram_labels()
+        }
+        self._stats_cache = (version, summary)
+        return summary
+
+    def _candidate_rows(self, normalized_query: str) -> Iterable[int]:
+        """부분 문자열 매칭 후보 행 (실제 매칭의 상위집합)"""
+        if len(normalized_query) < NGRAM_SIZE:
+            # trigram을 만들 수 없는 짧은 질의는 정규화된 문자열을 그대로 스캔
+            return range(len(self.records))
+
+        postings = []
+        for gram in ngrams(normalized_query):
+            rows = self.trigram_index.get(gram)
+            if rows is None:
+                return []
+            postings.append(rows)
+
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for rows in postings[1:]:
+            candidates.intersection_update(rows)
+            if not candidates:
+                break
+        return sorted(candidates)
+
+    def search_rows(self, query: str, observe: Optional[PhaseObserver] = None) -> List[int]:
+        """
+        저널 이름 또는 ISSN으로 검색한 행 번호 (Impact Factor 내림차순)
+
+        observe: normalize/match/sort 단계 시간을 받음
+        """
+        if not query:
+            return []
+
+        start = perf_counter()
+        normalized_query = normalize_string(query)
+        normalized = perf_counter()
+        names = self.normalized_names
+        issns = self.normalized_issns
+        rows = [
+            row
+            for row in self._candidate_rows(normalized_query)
+            if normalized_query in names[row] or normalized_query in issns[row]
+        ]
+        matched = perf_counter()
+
+        # 후보는 원래 순서를 유지하므로 안정 정렬로 기존 결과 순서와 동일하다
+        rows.sort(key=self.records.impact_factors.__getitem__, reverse=True)
+        if observe is not None:
+            observe('normalize', normalized - start)
+            observe('match', matched - normalized)
+            observe('sort', perf_counter() - matched)
+        return rows
+
+    def search(self, query: str) -> List[Dict]:
+        """search_rows 결과를 dict 목록으로 (벤치마크용, API 응답은 row_json으로 만든다)"""
+        return [self._journal(row) for row in self.search_rows(query)]
+
+    def fuzzy_search_rows(self, query: str, limit: int, offset: int = 0,
+                          observe: Optional[PhaseObserver] = None) -> Tuple[List[Tuple[int, float]], bool]:
+        """
+        오타/약어를 허용하는 순위 검색 (ISSN이 정확히 일치하면 그 저널이 맨 앞)
+
+        반환값: ([(행 번호, 점수), ...], 다음 페이지가 있는지)
+        observe: index_build(처음 한 번)/normalize/match 단계 시간을 받음
+        (match는 단어 확장, 후보 점수 계산과 순위 정렬을 포함)
+        """
+        fuzzy_index = self._fuzzy_index
+        if fuzzy_index is None:
+            start = perf_counter()
+            fuzzy_index = self._lazy_index('_fuzzy_index', self._build_fuzzy_index)
+            if observe is not None:
+                observe('index_build', perf_counter() - start)
+        sorted_rows = self.sorted_rows
+        start = perf_counter()
+
+        # ISSN이 정확히 일치하면 가장 앞에 둔다
+        issn_row = self.issn_index.get(normalize_string(query))
+
+        normalized = perf_counter()
+        # 앞 페이지까지 함께 받아야 ISSN 행을 뺀 뒤에도 페이지가 짧아지지 않는다
+        # (퍼지 인덱스는 어차피 offset + limit개를 모두 찾으므로 비용은 같다)
+        matches, has_more = fuzzy_index.search(query, offset + limit)
+        if observe is not None:
+            observe('normalize', normalized - start)
+            observe('match', perf_counter() - normalized)
+        scored = [(sorted_rows[rank], score) for rank, score in matches]
+        if issn_row is not None:
+            scored = [(issn_row, 1.0)] + [item for item in scored if item[0] != issn_row]
+            has_more = has_more or len(scored) > offset + limit
+        return scored[offset:offset + limit], has_more
+
+    def fuzzy_search(self, query: str, limit: int, offset: int = 0) -> Tuple[List[Dict], bool]:
+        """fuzzy_search_rows 결과를 score 필드가 붙은 dict 목록으로 (벤치마크용)"""
+        scored, has_more = self.fuzzy_search_rows(query, limit, offset)
+        return [{**self._journal(row), 'score': score} for row, score in scored], has_more
+
+    def suggest_rows(self, prefix: str, limit: int) -> List[int]:
+        """정규화된 이름/ISSN 접두어로 자동완성할 행 번호 (Impact Factor 상위 limit개)"""
+        trie = self._lazy_index('_suggest_trie', self._build_suggest_trie)
+        sorted_rows = self.sorted_rows
+        return [sorted_rows[rank] for rank in trie.lookup(normalize_string(prefix), limit)]
+
+    def suggest(self, prefix: str, limit: int) -> List[Dict]:
+        """suggest_rows 결과를 dict 목록으로 (벤치마크용)"""
+        return [self._journal(row) for row in self.suggest_rows(prefix, limit)]
@@ -0,0 +1,113 @@
+"""
+저널 레코드 열 저장소
+
+저널마다 dict를 두지 않고 필드별 배열(struct-of-arrays)로 보관한다.
+Impact Factor는 float64 배열, 카테고리/분위는 중복 없는 값 테이블의 코드 배열로
+저장하고, dict는 API 응답을 만들 때만 get()으로 만든다.
+숫자/코드 열은 메모리 매핑된 열 파일의 버퍼(memoryview)로 바꿔 끼울 수 있다 (catalog_loader.load_columns).
+"""
+
+from array import array
+from typing import Dict, List, Optional, Union
+
+# array 또는 메모리 매핑된 열 파일의 memoryview (인덱싱 결과는 둘 다 파이썬 int/float)
+Column = Union[array, memoryview]
+
+# 숫자/코드 열 이름
+COLUMN_FIELDS = ('impact_factors', 'category_codes', 'quartile_codes')
+
+# dict로 만들 때의 필드 순서 (catalog_loader.COLUMNS와 같음)
+FIELDS = ('name', 'issn', 'eissn', 'issn_l', 'impact_factor', 'category', 'quartile')
+OPTIONAL_FIELDS = ('eissn', 'issn_l')
+
+
+class ValueTable:
+    """반복되는 문자열을 작은 정수 코드로 바꾸는 테이블"""
+
+    __slots__ = ('values', 'codes')
+
+    def __init__(self):
+        self.values: List[str] = []
+        self.codes: Dict[str, int] = {}
+
+    def code(self, value: str) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+class JournalRecords:
+    """필드별 배열로 보관하는 저널 레코드 목록"""
+
+    def __init__(self):
+        self.names: List[str] = []
+        self.issns: List[str] = []
+        self.eissns: List[Optional[str]] = []
+        self.issn_ls: List[Optional[str]] = []
+        self.impact_factors = array('d')
+        self.category_codes = array('I')
+        self.quartile_codes = array('B')
+        self.categories = ValueTable()
+        self.quartiles = ValueTable()
+        # 위 필드 외의 값이 있는 드문 레코드만 행 번호로 따로 보관
+        self.extras: Dict[int, Dict] = {}
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getstate__(self) -> Dict:
+        """메모리 매핑된 열은 pickle할 수 없으므로 array로 복사해서 저장"""
+        state = self.__dict__.copy()
+        for name in COLUMN_FIELDS:
+            state[name] = to_array(state[name])
+        return state
+
+    def append(self, journal: Dict) -> int:
+        row = len(self.names)
+        self.names.append(journal['name'])
+        self.issns.append(journal['issn'])
+        self.eissns.append(journal.get('eissn'))
+        self.issn_ls.append(journal.get('issn_l'))
+        self.impact_factors.append(journal['impact_factor'])
+        self.category_codes.append(self.categories.code(journal['category']))
+        self.quartile_codes.append(self.quartiles.code(journal['quartile']))
+        self._set_extra(row, journal)
+        return row
+
+    def _set_extra(self, row: int, journal: Dict):
+        extra = {key: value for key, value in journal.items() if key not in FIELDS}
+        if extra:
+            self.extras[row] = extra
+        else:
+            self.extras.pop(row, None)
+
+    def category(self, row: int) -> str:
+        return self.categories.values[self.category_codes[row]]
+
+    def quartile(self, row: int) -> str:
+        return self.quartiles.values[self.quartile_codes[row]]
+
+    def get(self, row: int) -> Dict:
+        """행을 API 응답용 dict로 만듦 (값이 없는 선택 필드는 생략)"""
+        journal = {'name': self.names[row], 'issn': self.issns[row]}
+        if self.eissns[row] is not None:
+            journal['eissn'] = self.eissns[row]
+        if self.issn_ls[row] is not None:
+            journal['issn_l'] = self.issn_ls[row]
+        journal['impact_factor'] = self.impact_factors[row]
+        journal['category'] = self.category(row)
+        journal['quartile'] = self.quartile(row)
+        if row in self.extras:
+            journal.update(self.extras[row])
+        return journal
+
+
+def to_array(column: Column) -> array:
+    """memoryview 열을 같은 형식의 array로 복사 (array는 그대로 반환)"""
+    if isinstance(column, array):
+        return column
+    copy = array(column.format)
+    copy.frombytes(column.cast('B'))
+    return copy
@@ -0,0 +1,58 @@
+"""
+API 응답 JSON 직렬화
+
+orjson이 설치되어 있으면 사용하고, 없으면 표준 json 모듈로 같은 형식(UTF-8, 공백 없음)을
+만든다. JSON_SERIALIZER=json 환경 변수로 표준 모듈을 강제할 수 있다.
+
+저널 행처럼 미리 직렬화해 둔 조각은 RawJSON으로 감싸면 encode_object에서
+다시 인코딩하지 않고 그대로 이어 붙인다.
+"""
+
+import json
+import os
+from typing import Any, Dict, Iterable
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None and os.environ.get('JSON_SERIALIZER', 'orjson') != 'json':
+    BACKEND = 'orjson'
+
+    def dumps(obj: Any) -> bytes:
+        """객체를 UTF-8 JSON bytes로 직렬화"""
+        return orjson.dumps(obj)
+else:
+    BACKEND = 'json'
+    _encoder = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+
+    def dumps(obj: Any) -> bytes:
+        """객체를 UTF-8 JSON bytes로 직렬화"""
+        return _encoder.encode(obj).encode('utf-8')
+
+
+class RawJSON:
+    """이미 직렬화된 JSON 조각"""
+
+    __slots__ = ('data',)
+
+    def __init__(self, data: bytes):
+        self.data = data
+
+
+def encode_array(fragments: Iterable[bytes]) -> RawJSON:
+    """직렬화된 조각들을 JSON 배열로 이어 붙임"""
+    return RawJSON(b'[%b]' % b','.join(fragments))
+
+
+def encode_object(fields: Dict[str, Any]) -> bytes:
+    """JSON 객체 직렬화 (RawJSON 값은 다시 인코딩하지 않음, 필드 순서 유지)"""
+    # 큰 배열 조각을 여러 번 복사하지 않도록 한 번의 join으로 만든다
+    parts = [b'{']
+    for key, value in fields.items():
+        if len(parts) > 1:
+            parts.append(b',')
+        parts += (dumps(key), b':', value.data if isinstance(value, RawJSON) else dumps(value))
+    parts.append(b'}')
+    return b''.join(parts)
@@ -0,0 +1,115 @@
+"""
+저널 API 부하 테스트
+
+여러 스레드가 keep-alive 연결로 API를 반복 호출하고
+처리량(req/s)과 p50/p99 지연시간을 엔드포인트별로 출력한다.
+
+사용법:
+    python loadtest.py
+    python loadtest.py --url http://localhost:5001 --concurrency 64 --duration 30
+"""
+
+import argparse
+import http.client
+import random
+import threading
+import time
+from collections import defaultdict
+from urllib.parse import urlsplit
+
+# (이름, 경로) - 실제 트래픽처럼 검색을 가장 많이 섞는다
+REQUESTS = [
+    ('search', '/api/search?q=nature'),
+    ('search', '/api/search?q=lancet'),
+    ('search', '/api/search?q=cell'),
+    ('search', '/api/search?q=journal%20of'),
+    ('search', '/api/search?q=Lancett&mode=fuzzy'),
+    ('suggest', '/api/suggest?prefix=nat'),
+    ('journals', '/api/journals?limit=50'),
+    ('journals', '/api/journals?category=physics'),
+    ('stats', '/api/stats'),
+    ('journal', '/api/journal/0028-0836'),
+]
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p / 100))] if values else 0.0
+
+
+def worker(host, port, deadline, seed, latencies, errors):
+    rng = random.Random(seed)
+    conn = http.client.HTTPConnection(host, port, timeout=10)
+    while time.perf_counter() < deadline:
+        name, path = rng.choice(REQUESTS)
+        start = time.perf_counter()
+        try:
+            conn.request('GET', path)
+            response = conn.getresponse()
+            response.read()
+            ok = response.status < 500
+        except (OSError, http.client.HTTPException):
+            ok = False
+            conn.close()
+            conn = http.client.HTTPConnection(host, port, timeout=10)
+        elapsed = (time.perf_counter() - start) * 1000
+        if ok:
+            latencies[name].append(elapsed)
+        else:
+            errors[name] += 1
+    conn.close()
+
+
+def run(url, concurrency, duration):
+    parts = urlsplit(url)
+    host, port = parts.hostname, parts.port or 80
+
+    # 스레드마다 따로 기록하고 끝난 뒤 합친다 (측정 중 잠금 없음)
+    results = [(defaultdict(list), defaultdict(int)) for _ in range(concurrency)]
+    deadline = time.perf_counter() + duration
+    threads = [
+        threading.Thread(target=worker, args=(host, port, deadline, i, *results[i]))
+        for i in range(concurrency)
+    ]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    latencies = defaultdict(list)
+    errors = defaultdict(int)
+    for per_thread_latencies, per_thread_errors in results:
+        for name, values in per_thread_latencies.items():
+            latencies[name].extend(values)
+        for name, count in per_thread_errors.items():
+            errors[name] += count
+
+    everything = [v for values in latencies.values() for v in values]
+    print("=" * 72)
+    print(f"🎯 {url} | 동시 연결 {concurrency} | {elapsed:.1f}s")
+    print("=" * 72)
+    print(f"{'endpoint':>10} | {'requests':>9} | {'errors':>6} | {'req/s':>9} | {'p50 ms':>8} | {'p99 ms':>8}")
+    print("-" * 72)
+    for name in sorted(latencies):
+        values = latencies[name]
+        print(f"{name:>10} | {len(values):>9} | {errors[name]:>6} | {len(values) / elapsed:>9.1f}"
+              f" | {percentile(values, 50):>8.2f} | {percentile(values, 99):>8.2f}")
+    print("-" * 72)
+    print(f"{'total':>10} | {len(everything):>9} | {sum(errors.values()):>6} | {len(everything) / elapsed:>9.1f}"
+          f" | {percentile(everything, 50):>8.2f} | {percentile(everything, 99):>8.2f}")
+    print("=" * 72)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='저널 API 부하 테스트')
+    parser.add_argument('--url', default='http://localhost:5001')
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--duration', type=float, default=10.0)
+    args = parser.parse_args()
+    run(args.url, args.concurrency, args.duration)
+
+
+if __name__ == '__main__':
+    main()
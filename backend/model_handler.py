@@ -3,14 +3,29 @@ import numpy as np
 import tensorflow as tf
 from tensorflow import keras
 import os
+import queue
+import threading
+
+from clip_buffer import CLIP_LENGTH, ClipBuffer
+from frame_sampling import FrameSampler
+
+# 학습 클립 하나가 담는 시간 (초, generate_sample_data.py의 영상 길이)
+# 영상 분석에서는 이 시간 동안 clip_length 프레임을 고르게 뽑아 학습 클립과 같은 간격으로 만든다
+CLIP_SECONDS = 5.0
 
 class ModelHandler:
     """이상행동 감지 모델 핸들러"""
     
-    def __init__(self, model_path='models/abnormal_detector.h5', use_no_normal_model=False):
+    # 모델 입력 프레임 크기 (너비, 높이)
+    input_size = (224, 224)
+    
+    def __init__(self, model_path='models/abnormal_detector.h5', use_no_normal_model=False, clip_stride=8):
         self.model_path = model_path
         self.model = None
         self.use_no_normal_model = use_no_normal_model
+        # 실시간 스트림: 카메라별 클립 버퍼와 클립 예측 간격 (프레임 수)
+        self.clip_stride = clip_stride
+        self.clip_buffers = {}
         self.confidence_threshold = 0.6  # 정상 없는 모델용 임계값
         
         # 정상 데이터 없는 모델 사용 시
@@ -70,56 +85,150 @@ class ModelHandler:
     def preprocess_frame(self, frame):
         """프레임 전처리"""
         # 리사이즈
-        resized = cv2.resize(frame, (224, 224))
+        resized = cv2.resize(frame, self.input_size)
+        # OpenCV의 BGR을 학습 데이터(preprocess_data.extract_frames)와 같은 RGB로
+        resized = cv2.cvtColor(resized, cv2.COLOR_BGR2RGB)
         # 정규화
         normalized = resized.astype('float32') / 255.0
         # 배치 차원 추가
         return np.expand_dims(normalized, axis=0)
     
+    def preprocess_batch(self, items):
+        """
+        프레임 (H, W, 3) 또는 클립 (T, H, W, 3) 목록을 하나의 연속 배열로 전처리
+        
+        반환값: (N, 224, 224, 3) 또는 (N, T, 224, 224, 3) float32 배열
+        """
+        first_shape = np.shape(items[0])
+        width, height = self.input_size
+        batch = np.empty((len(items),) + first_shape[:-3] + (height, width, 3), dtype=np.float32)
+        # 항목/클립 구분 없이 프레임 단위로 보는 뷰 (같은 메모리)
+        frames = batch.reshape((-1, height, width, 3))
+        index = 0
+        for item in items:
+            item = np.asarray(item)
+            if item.shape[:-3] != first_shape[:-3]:
+                raise ValueError('All items in a batch must have the same number of frames')
+            for frame in item.reshape((-1,) + item.shape[-3:]):
+                # 리사이즈/RGB 변환 결과(uint8)를 배치 배열에 바로 복사하고, 정규화는 마지막에 한 번에
+                frames[index] = cv2.cvtColor(cv2.resize(frame, self.input_size), cv2.COLOR_BGR2RGB)
+                index += 1
+        np.divide(batch, 255.0, out=batch)
+        return batch
+    
     def predict(self, frame):
         """단일 프레임 예측"""
-        # 전처리
-        processed_frame = self.preprocess_frame(frame)
-        
-        if self.model is not None:
-            # 실제 모델 추론
-            predictions = self.model.predict(processed_frame, verbose=0)
-            class_idx = np.argmax(predictions[0])
-            confidence = float(predictions[0][class_idx])
-            
-            # 정상 없는 모델: 신뢰도가 임계값 이하면 정상으로 처리
-            if self.use_no_normal_model:
-                if confidence < self.confidence_threshold:
-                    action = 'normal'
-                    is_abnormal = False
-                    severity = 'low'
-                else:
-                    action = self.classes[class_idx]
-                    is_abnormal = True
-                    severity = self.severity_map.get(action, 'medium')
+        return self.predict_batch([frame])[0]
+    
+    def predict_batch(self, items):
+        """
+        여러 프레임(또는 클립)을 한 번의 순전파로 예측
+        
+        items: 프레임 (H, W, 3) 또는 클립 (T, H, W, 3) 목록 (한 배치 안에서는 같은 형태)
+        반환값: 항목마다 predict와 같은 형식의 결과 dict 목록
+        """
+        if len(items) == 0:
+            return []
+        
+        if self.model is None:
+            # 데모 모드: 랜덤 예측
+            return [self._demo_result() for _ in items]
+        
+        return self.predict_preprocessed(self.preprocess_batch(items))
+    
+    def predict_preprocessed(self, batch):
+        """전처리가 끝난 배치 배열 (N, ...) 예측 (결과는 predict와 같은 형식의 dict 목록)"""
+        if self.model is None:
+            return [self._demo_result() for _ in range(len(batch))]
+        
+        # 실제 모델 추론 (predict_on_batch는 배치를 나누지 않고 한 번에 실행)
+        predictions = np.asarray(self.model.predict_on_batch(batch))
+        return [self._model_result(probabilities) for probabilities in predictions]
+    
+    @property
+    def uses_clips(self):
+        """모델이 클립 (N, T, H, W, 3)을 입력으로 받는 3D-CNN인지"""
+        shape = getattr(self.model, 'input_shape', None)
+        return shape is not None and len(shape) == 5
+    
+    @property
+    def clip_length(self):
+        """모델 입력 클립의 프레임 수 (모델이 없으면 학습 설정의 기본값)"""
+        shape = getattr(self.model, 'input_shape', None)
+        if shape is not None and len(shape) == 5 and shape[1]:
+            return shape[1]
+        return CLIP_LENGTH
+    
+    def clip_buffer(self, camera_id):
+        """카메라의 클립 버퍼 (처음 요청할 때 한 번만 할당)"""
+        buffer = self.clip_buffers.get(camera_id)
+        if buffer is None:
+            buffer = self.clip_buffers[camera_id] = ClipBuffer(
+                self.clip_length, self.clip_stride, self.input_size
+            )
+        return buffer
+    
+    def predict_stream(self, frame, camera_id='camera_1'):
+        """
+        실시간 스트림 프레임 하나를 카메라 버퍼에 추가하고, 슬라이딩 윈도우가 찼으면 클립 예측
+        
+        반환값: clip_stride 프레임마다 최근 clip_length 프레임 클립의 결과 dict, 그 외에는 None
+        (카메라 하나의 프레임은 한 스레드에서 순서대로 넣어야 한다)
+        """
+        buffer = self.clip_buffer(camera_id)
+        clip = buffer.push(frame)
+        if clip is None:
+            return None
+        # 클립은 버퍼의 뷰라서 복사 없이 배치 차원만 붙여 바로 추론한다
+        result = self.predict_preprocessed(clip[np.newaxis])[0]
+        result['frame_number'] = buffer.frames_seen - 1
+        result['camera_id'] = camera_id
+        return result
+    
+    def _model_result(self, probabilities):
+        """모델 출력 (클래스별 확률) 하나를 결과 dict로 변환"""
+        class_idx = int(np.argmax(probabilities))
+        confidence = float(probabilities[class_idx])
+        
+        # 정상 없는 모델: 신뢰도가 임계값 이하면 정상으로 처리
+        if self.use_no_normal_model:
+            if confidence < self.confidence_threshold:
+                action = 'normal'
+                is_abnormal = False
+                severity = 'low'
             else:
-                action = self.classes[class_idx]
-                is_abnormal = action != 'normal'
-                severity = self.severity_map.get(action, 'low')
-        else:
-            # 데모 모드: 랜덤 예측 (실제로는 대부분 정상)
-            if np.random.random() > 0.95:  # 5% 확률로 이상행동
-                start_idx = 0 if not self.use_no_normal_model else 0
-                end_idx = len(self.classes) if not self.use_no_normal_model else len(self.classes)
-                if not self.use_no_normal_model:
-                    class_idx = np.random.randint(1, end_idx)  # 정상 제외
-                else:
-                    class_idx = np.random.randint(start_idx, end_idx)
-                confidence = np.random.uniform(0.7, 0.95)
                 action = self.classes[class_idx]
                 is_abnormal = True
-            else:
-                action = 'normal'
-                confidence = np.random.uniform(0.85, 0.99)
-                is_abnormal = False
-            
+                severity = self.severity_map.get(action, 'medium')
+        else:
+            action = self.classes[class_idx]
+            is_abnormal = action != 'normal'
             severity = self.severity_map.get(action, 'low')
         
+        return self._result(action, confidence, is_abnormal, severity, class_idx)
+    
+    def _demo_result(self):
+        """데모 모드 랜덤 예측 (실제로는 대부분 정상)"""
+        if np.random.random() > 0.95:  # 5% 확률로 이상행동
+            if not self.use_no_normal_model:
+                class_idx = np.random.randint(1, len(self.classes))  # 정상 제외
+            else:
+                class_idx = np.random.randint(0, len(self.classes))
+            confidence = np.random.uniform(0.7, 0.95)
+            action = self.classes[class_idx]
+            is_abnormal = True
+        else:
+            action = 'normal'
+            # 정상 없는 모델은 정상 클래스가 없으므로 모든 클래스가 낮은 값
+            class_idx = self.classes.index('normal') if 'normal' in self.classes else -1
+            confidence = np.random.uniform(0.85, 0.99)
+            is_abnormal = False
+        
+        severity = self.severity_map.get(action, 'low')
+        return self._result(action, confidence, is_abnormal, severity, class_idx)
+    
+    def _result(self, action, confidence, is_abnormal, severity, class_idx):
+        """predict/predict_batch 결과 형식"""
         return {
             'action': action,
             'confidence': confidence,
@@ -133,29 +242,41 @@ class ModelHandler:
             }
         }
     
-    def predict_video(self, video_path, camera_id='camera_1'):
-        """비디오 파일 전체 분석"""
-        cap = cv2.VideoCapture(video_path)
-        results = []
-        frame_count = 0
+    def predict_video(self, video_path, camera_id='camera_1', pipelined=True, batch_size=16, queue_size=64,
+                      interval=1.0):
+        """
+        비디오 파일 전체 분석
         
-        # 매 30프레임마다 분석 (약 1초마다, 30fps 기준)
-        frame_skip = 30
+        interval: 분석 간격 (초, 영상 FPS로 프레임 간격을 정함)
+        pipelined: 읽기 스레드가 디코딩/리사이즈하는 동안 배치 추론을 함께 진행 (결과는 같음)
+        batch_size: 파이프라인 모드에서 한 번에 추론할 프레임 수
+                    (클립 모델이면 batch_size // clip_length개 클립, 최소 1개)
+        queue_size: 읽기 스레드와 추론 사이 대기열 길이 (메모리 상한)
         
-        while cap.isOpened():
-            ret, frame = cap.read()
-            if not ret:
-                break
-            
-            if frame_count % frame_skip == 0:
-                result = self.predict(frame)
-                result['frame_number'] = frame_count
-                result['camera_id'] = camera_id
-                results.append(result)
-            
-            frame_count += 1
+        3D-CNN 모델(uses_clips)이면 CLIP_SECONDS 동안 clip_length 프레임을 뽑아 클립으로 묶고,
+        interval초마다 최근 클립 하나를 예측한다 (결과의 frame_number는 클립의 마지막 프레임).
+        """
+        cap = cv2.VideoCapture(video_path)
         
-        cap.release()
+        # interval초마다 분석 (FPS를 모르면 프레임 타임스탬프 기준)
+        sampler = FrameSampler(cap)
+        clip_stride = None
+        if self.uses_clips:
+            # 클립 안의 프레임 간격으로 샘플링하고, interval초에 해당하는 프레임 수마다 클립을 내보낸다
+            frame_interval = CLIP_SECONDS / self.clip_length
+            clip_stride = max(1, round(interval / frame_interval))
+            frames = sampler.sample_interval(frame_interval)
+        else:
+            frames = sampler.sample_interval(interval)
+        
+        try:
+            if pipelined:
+                results = self._predict_video_pipelined(frames, camera_id, batch_size, queue_size, clip_stride)
+            else:
+                results = self._predict_video_sequential(frames, camera_id, clip_stride)
+        finally:
+            cap.release()
+        frame_count = sampler.frame_count
         
         # 이상행동만 필터링
         abnormal_results = [r for r in results if r['is_abnormal']]
@@ -166,3 +287,109 @@ class ModelHandler:
             'abnormal_detections': len(abnormal_results),
             'detections': abnormal_results
         }
+    
+    def _video_clip_buffer(self, clip_stride):
+        """영상 하나를 분석하는 동안만 쓰는 클립 버퍼 (실시간 스트림의 카메라 버퍼와 섞이지 않게)"""
+        return ClipBuffer(self.clip_length, clip_stride, self.input_size)
+    
+    def _predict_video_sequential(self, frames, camera_id, clip_stride=None):
+        """한 스레드에서 샘플 프레임을 읽으며 하나씩 (클립 모델이면 클립이 찰 때마다) 예측"""
+        clips = self._video_clip_buffer(clip_stride) if clip_stride else None
+        results = []
+        for frame_number, frame in frames:
+            if clips is None:
+                result = self.predict(frame)
+            else:
+                clip = clips.push(frame)
+                if clip is None:
+                    continue
+                result = self.predict_preprocessed(clip[np.newaxis])[0]
+            result['frame_number'] = frame_number
+            result['camera_id'] = camera_id
+            results.append(result)
+        return results
+    
+    def _predict_video_pipelined(self, sampled_frames, camera_id, batch_size, queue_size, clip_stride=None):
+        """
+        읽기 스레드 + 배치 추론 파이프라인
+        
+        읽기 스레드는 FrameSampler로 분석할 프레임만 디코딩해서(건너뛸 프레임은 grab()만)
+        모델 입력 크기로 줄인 뒤 대기열에 넣는다 (OpenCV는 이 동안 GIL을 놓는다).
+        현재 스레드는 대기열에서 batch_size개씩 모아 한 번에 추론한다.
+        clip_stride가 있으면 프레임을 클립 버퍼에 넣고, 클립이 찰 때마다 클립을 배치에 모은다.
+        """
+        frames = queue.Queue(maxsize=queue_size)
+        end = object()
+        stop = threading.Event()
+        reader_state = {'error': None}
+        
+        def read():
+            try:
+                for frame_number, frame in sampled_frames:
+                    if stop.is_set():
+                        break
+                    resized = cv2.resize(frame, self.input_size)
+                    frames.put((frame_number, cv2.cvtColor(resized, cv2.COLOR_BGR2RGB)))
+            except Exception as e:
+                reader_state['error'] = e
+            finally:
+                frames.put(end)
+        
+        reader = threading.Thread(target=read, name='video-reader', daemon=True)
+        reader.start()
+        
+        width, height = self.input_size
+        clips = self._video_clip_buffer(clip_stride) if clip_stride else None
+        if clips is None:
+            batch = np.empty((batch_size, height, width, 3), dtype=np.float32)
+        else:
+            # 프레임 모드와 같은 메모리를 쓰도록 batch_size를 프레임 수로 보고 클립 개수를 정한다
+            batch = np.empty((max(1, batch_size // self.clip_length), self.clip_length, height, width, 3),
+                             dtype=np.float32)
+        frame_numbers = []
+        results = []
+        
+        def flush():
+            size = len(frame_numbers)
+            if not size:
+                return
+            inputs = batch[:size]
+            if clips is None:
+                # 클립은 버퍼에 넣을 때 이미 정규화했다
+                np.divide(inputs, 255.0, out=inputs)
+            for frame_number, result in zip(frame_numbers, self.predict_preprocessed(inputs)):
+                result['frame_number'] = frame_number
+                result['camera_id'] = camera_id
+                results.append(result)
+            frame_numbers.clear()
+        
+        try:
+            while True:
+                item = frames.get()
+                if item is end:
+                    break
+                frame_number, resized = item
+                if clips is None:
+                    batch[len(frame_numbers)] = resized
+                else:
+                    clip = clips.push_rgb(resized)
+                    if clip is None:
+                        continue
+                    batch[len(frame_numbers)] = clip
+                frame_numbers.append(frame_number)
+                if len(frame_numbers) == len(batch):
+                    flush()
+            flush()
+        finally:
+            # 추론 중 예외가 나도 읽기 스레드가 대기열에 막히지 않도록 비우면서 종료를 기다린다
+            stop.set()
+            while reader.is_alive():
+                try:
+                    frames.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+            reader.join()
+        
+        if reader_state['error'] is not None:
+            raise reader_state['error']
+        return results
@@ -20,6 +20,8 @@ from sklearn.model_selection import train_test_split
 from tqdm import tqdm
 import shutil
 
+from frame_sampling import FrameSampler
+
 class DataPreprocessor:
     def __init__(self, 
                  raw_data_dir='data/raw',
@@ -61,7 +63,8 @@ class DataPreprocessor:
             print(f"⚠️  영상 열기 실패: {video_path}")
             return None
         
-        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        sampler = FrameSampler(cap)
+        total_frames = sampler.frame_count
         
         if total_frames < num_frames:
             print(f"⚠️  프레임 부족 ({total_frames} < {num_frames}): {video_path}")
@@ -71,23 +74,19 @@ class DataPreprocessor:
         # 균등한 간격으로 프레임 인덱스 계산
         frame_indices = np.linspace(0, total_frames - 1, num_frames, dtype=int)
         
+        # 간격이 짧으면 grab으로 건너뛰고, 키프레임 간격보다 길 때만 위치 이동
         frames = []
-        for idx in frame_indices:
-            cap.set(cv2.CAP_PROP_POS_FRAMES, idx)
-            ret, frame = cap.read()
-            
-            if ret:
-                # 리사이즈 및 정규화
-                frame = cv2.resize(frame, self.frame_size)
-                frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                frame = frame.astype('float32') / 255.0
-                frames.append(frame)
-            else:
-                print(f"⚠️  프레임 읽기 실패 (idx: {idx}): {video_path}")
+        for idx, frame in sampler.sample_at(frame_indices):
+            # 리사이즈 및 정규화
+            frame = cv2.resize(frame, self.frame_size)
+            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            frame = frame.astype('float32') / 255.0
+            frames.append(frame)
         
         cap.release()
         
         if len(frames) != num_frames:
+            print(f"⚠️  프레임 읽기 실패 ({len(frames)}/{num_frames}): {video_path}")
             return None
         
         return np.array(frames)
@@ -0,0 +1,217 @@
+"""
+요청 지표 수집 (Prometheus 텍스트 형식)
+
+라우트별 요청 수, 지연 시간/응답 크기 히스토그램과 검색 단계별 소요 시간을 모은다.
+
+요청 경로에서 잠금을 쓰지 않도록 스레드마다 자기 카운터(샤드)를 따로 두고,
+각 스레드는 자기 샤드에만 쓴다. /metrics를 요청할 때 모든 샤드를 합친다.
+히스토그램은 고정 구간 카운터라서 기록 한 번이 이진 탐색과 정수 덧셈 하나다.
+스레드가 끝나면 그 샤드를 종료된 스레드의 합계(retired)에 더하고 목록에서 뺀다.
+요청마다 새 스레드를 쓰는 서버(threaded Werkzeug)에서도 샤드 수는 살아 있는 스레드 수를 넘지 않고,
+카운터는 줄어들지 않는다.
+
+지표는 프로세스마다 따로 모은다 (gunicorn 워커마다 자기 /metrics를 응답한다).
+"""
+
+import bisect
+import threading
+import weakref
+from typing import Callable, Dict, List, Optional, Tuple
+
+# 지연 시간 구간 상한 (초)
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+# 응답 크기 구간 상한 (바이트)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+# 검색 단계 구간 상한 (초)
+PHASE_BUCKETS = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.05, 0.25)
+
+PREFIX = 'journal_api'
+
+
+class Histogram:
+    """고정 구간 히스토그램 (구간별 카운트는 누적하지 않고 보관)"""
+
+    __slots__ = ('buckets', 'counts', 'sum')
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        # 마지막 칸은 가장 큰 상한을 넘는 값 (+Inf)
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+    def add(self, other: 'Histogram'):
+        # 다른 스레드가 기록하는 중일 수 있으므로 복사본을 더한다 (값은 단조 증가)
+        for i, count in enumerate(list(other.counts)):
+            self.counts[i] += count
+        self.sum += other.sum
+
+
+class _Shard:
+    """스레드 하나가 기록하는 카운터"""
+
+    __slots__ = ('requests', 'latency', 'sizes', 'phases')
+
+    def __init__(self):
+        self.requests: Dict[Tuple[str, str, int], int] = {}
+        self.latency: Dict[str, Histogram] = {}
+        self.sizes: Dict[str, Histogram] = {}
+        self.phases: Dict[Tuple[str, str], Histogram] = {}
+
+    def add(self, other: '_Shard'):
+        """other의 카운터를 이 샤드에 더함"""
+        for key, count in list(other.requests.items()):
+            self.requests[key] = self.requests.get(key, 0) + count
+        for totals, histograms in ((self.latency, other.latency), (self.sizes, other.sizes),
+                                   (self.phases, other.phases)):
+            for key, histogram in list(histograms.items()):
+                total = totals.get(key)
+                if total is None:
+                    total = totals[key] = Histogram(histogram.buckets)
+                total.add(histogram)
+
+
+class _ThreadToken:
+    """스레드가 끝나면 thread-local과 함께 사라지는 객체 (샤드 정리 시점 감지용)"""
+
+    __slots__ = ('__weakref__',)
+
+
+def _labels(**labels) -> str:
+    return ','.join(f'{name}="{_escape(str(value))}"' for name, value in labels.items())
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_histogram(lines: List[str], name: str, labels: str, histogram: Histogram):
+    separator = ',' if labels else ''
+    cumulative = 0
+    for bound, count in zip(histogram.buckets, histogram.counts):
+        cumulative += count
+        lines.append(f'{name}_bucket{{{labels}{separator}le="{bound!r}"}} {cumulative}')
+    cumulative += histogram.counts[-1]
+    lines.append(f'{name}_bucket{{{labels}{separator}le="+Inf"}} {cumulative}')
+    lines.append(f'{name}_sum{{{labels}}} {histogram.sum:.9g}')
+    lines.append(f'{name}_count{{{labels}}} {cumulative}')
+
+
+class RequestMetrics:
+    """스레드별 샤드에 기록하고 내보낼 때 합치는 요청 지표"""
+
+    def __init__(self):
+        self._local = threading.local()
+        self._shards: List[_Shard] = []
+        # 끝난 스레드들의 샤드를 합친 값
+        self._retired = _Shard()
+        # 스레드의 샤드를 등록/정리할 때만 사용 (요청마다 잡지 않음)
+        self._register_lock = threading.Lock()
+        self._phase_observers: Dict[str, Callable[[str, float], None]] = {}
+
+    def _shard(self) -> _Shard:
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = _Shard()
+            token = self._local.token = _ThreadToken()
+            with self._register_lock:
+                self._shards.append(shard)
+            # 스레드가 끝나 thread-local이 정리되면 샤드를 합계로 옮긴다
+            weakref.finalize(token, self._retire, shard)
+            return shard
+
+    def _retire(self, shard: _Shard):
+        with self._register_lock:
+            self._retired.add(shard)
+            self._shards.remove(shard)
+
+    def observe_request(self, route: str, method: str, status: int, seconds: float, size: Optional[int]):
+        """요청 하나 기록 (size: 스트리밍 응답처럼 크기를 모르면 None)"""
+        shard = self._shard()
+        key = (route, method, status)
+        shard.requests[key] = shard.requests.get(key, 0) + 1
+        latency = shard.latency.get(route)
+        if latency is None:
+            latency = shard.latency[route] = Histogram(LATENCY_BUCKETS)
+        latency.observe(seconds)
+        if size is not None:
+            sizes = shard.sizes.get(route)
+            if sizes is None:
+                sizes = shard.sizes[route] = Histogram(SIZE_BUCKETS)
+            sizes.observe(size)
+
+    def observe_phase(self, mode: str, phase: str, seconds: float):
+        """검색 단계 하나의 소요 시간 기록"""
+        shard = self._shard()
+        key = (mode, phase)
+        histogram = shard.phases.get(key)
+        if histogram is None:
+            histogram = shard.phases[key] = Histogram(PHASE_BUCKETS)
+        histogram.observe(seconds)
+
+    def phase_observer(self, mode: str) -> Callable[[str, float], None]:
+        """검색 모드 하나의 (단계, 초) 기록 함수 (JournalCatalog 검색 메서드의 observe 인자)"""
+        observer = self._phase_observers.get(mode)
+        if observer is None:
+            def observer(phase: str, seconds: float, mode=mode):
+                self.observe_phase(mode, phase, seconds)
+            self._phase_observers[mode] = observer
+        return observer
+
+    def render(self, cache_stats: Optional[Dict] = None) -> str:
+        """모든 샤드를 합친 Prometheus 텍스트 (cache_stats: ResponseCache.stats())"""
+        # 목록과 합계를 같이 읽어야 그 사이에 끝난 스레드가 두 번 세어지지 않는다
+        totals = _Shard()
+        with self._register_lock:
+            shards = list(self._shards)
+            totals.add(self._retired)
+        for shard in shards:
+            totals.add(shard)
+
+        lines = [
+            f'# HELP {PREFIX}_requests_total Requests by route, method and status.',
+            f'# TYPE {PREFIX}_requests_total counter',
+        ]
+        for (route, method, status), count in sorted(totals.requests.items()):
+            lines.append(f'{PREFIX}_requests_total{{{_labels(route=route, method=method, status=status)}}} {count}')
+
+        for name, description, histograms in (
+            ('request_duration_seconds', 'Request latency by route (until the response headers are ready).',
+             totals.latency),
+            ('response_size_bytes', 'Response body size by route (streamed responses are not counted).',
+             totals.sizes),
+        ):
+            lines.append(f'# HELP {PREFIX}_{name} {description}')
+            lines.append(f'# TYPE {PREFIX}_{name} histogram')
+            for route, histogram in sorted(histograms.items()):
+                _format_histogram(lines, f'{PREFIX}_{name}', _labels(route=route), histogram)
+
+        lines.append(f'# HELP {PREFIX}_search_phase_seconds Time spent in each search phase.')
+        lines.append(f'# TYPE {PREFIX}_search_phase_seconds histogram')
+        for (mode, phase), histogram in sorted(totals.phases.items()):
+            _format_histogram(lines, f'{PREFIX}_search_phase_seconds', _labels(mode=mode, phase=phase), histogram)
+
+        if cache_stats is not None:
+            lines.append(f'# HELP {PREFIX}_response_cache_lookups_total Response cache lookups by result.')
+            lines.append(f'# TYPE {PREFIX}_response_cache_lookups_total counter')
+            lines.append(f'{PREFIX}_response_cache_lookups_total{{result="hit"}} {cache_stats["hits"]}')
+            lines.append(f'{PREFIX}_response_cache_lookups_total{{result="miss"}} {cache_stats["misses"]}')
+            for field, kind, description in (
+                ('hit_ratio', 'gauge', 'Response cache hits / lookups since start.'),
+                ('evictions', 'counter', 'Entries evicted by the entry or byte limit.'),
+                ('oversized', 'counter', 'Bodies not cached because they exceed the per-body limit.'),
+                ('expirations', 'counter', 'Entries dropped after their TTL.'),
+                ('invalidations', 'counter', 'Cache flushes after a catalogue change.'),
+                ('entries', 'gauge', 'Entries currently cached.'),
+                ('bytes', 'gauge', 'Bytes of cached response bodies.'),
+            ):
+                name = f'{PREFIX}_response_cache_{field}' + ('_total' if kind == 'counter' else '')
+                lines.append(f'# HELP {name} {description}')
+                lines.append(f'# TYPE {name} {kind}')
+                lines.append(f'{name} {cache_stats[field]}')
+
+        return '\n'.join(lines) + '\n'
@@ -0,0 +1,120 @@
+"""
+API 응답 캐시 (LRU + TTL)
+
+직렬화가 끝난 응답 본문(bytes)을 정규화된 질의/파라미터 키로 보관한다.
+항목 수와 본문 바이트 합계를 모두 제한하고, 한도를 넘으면 오래 사용하지 않은 항목부터 버린다.
+카탈로그 버전이 올라가면 캐시 전체를 비운다.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional
+
+
+class ResponseCache:
+    """카탈로그 버전에 묶인 LRU + TTL 캐시"""
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 300.0, max_bytes: int = 64 * 1024 * 1024,
+                 max_body_bytes: Optional[int] = None):
+        """
+        max_bytes: 보관할 본문 바이트 합계 한도
+        max_body_bytes: 이보다 큰 본문은 저장하지 않음 (기본 max_bytes / 16,
+                        전체 목록 같은 큰 응답 하나가 캐시를 모두 밀어내지 않게)
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.max_body_bytes = max_bytes // 16 if max_body_bytes is None else max_body_bytes
+        self._entries: 'OrderedDict[Hashable, tuple]' = OrderedDict()
+        self._bytes = 0
+        self._version = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+        self.oversized = 0
+
+    def _check_version(self, version) -> bool:
+        """
+        더 새로운 카탈로그 버전이면 모든 항목을 버림 (잠금 안에서 호출)
+
+        교체 중에 이전 스냅샷으로 처리하던 요청이 새 항목을 지우지 않도록 버전은 앞으로만 바뀐다.
+        반환값: version이 현재 캐시 버전인지
+        """
+        if self._version is None or version > self._version:
+            if self._entries:
+                self.invalidations += 1
+                self._entries.clear()
+                self._bytes = 0
+            self._version = version
+        return version == self._version
+
+    def _pop(self, key: Hashable):
+        _, body = self._entries.pop(key)
+        self._bytes -= len(body)
+
+    def get(self, version, key: Hashable) -> Optional[bytes]:
+        if self.max_entries <= 0:
+            return None
+        with self._lock:
+            if not self._check_version(version):
+                self.misses += 1
+                return None
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, body = entry
+            if expires_at < time.monotonic():
+                self._pop(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return body
+
+    def set(self, version, key: Hashable, body: bytes):
+        if self.max_entries <= 0:
+            return
+        if len(body) > self.max_body_bytes:
+            with self._lock:
+                self.oversized += 1
+            return
+        with self._lock:
+            if not self._check_version(version):
+                return
+            if key in self._entries:
+                self._pop(key)
+            self._entries[key] = (time.monotonic() + self.ttl, body)
+            self._bytes += len(body)
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._pop(next(iter(self._entries)))
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'max_body_bytes': self.max_body_bytes,
+                'ttl_seconds': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': round(self.hits / lookups, 4) if lookups else 0.0,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'invalidations': self.invalidations,
+                'oversized': self.oversized,
+            }
@@ -0,0 +1,87 @@
+"""
+자동완성용 접두어 트라이
+
+정규화된 저널 이름/ISSN으로 트라이를 만들고, 각 노드에 그 아래 저널 중
+Impact Factor 상위 k개를 미리 저장한다. 조회는 접두어 길이만큼 내려가기만 하면
+되고 정렬은 하지 않는다.
+
+메모리를 줄이기 위해 저널이 k개 이하로 남는 부분 트리는 더 나누지 않고
+(키, 순위) 목록 하나로 보관한다 (burst trie). 이런 노드에 도달하면 남은 접두어로
+최대 k개 항목만 걸러낸다.
+"""
+
+from typing import Dict, List, Sequence, Tuple
+
+# 노드마다 저장하는 상위 저널 수 (= 한 번에 돌려줄 수 있는 최대 제안 수)
+DEFAULT_TOP_K = 10
+# 같은 키가 매우 많을 때 무한히 내려가지 않도록 하는 깊이 제한
+MAX_DEPTH = 64
+
+
+class _Node:
+    __slots__ = ('children', 'top', 'bucket')
+
+    def __init__(self, top: Tuple[int, ...], children: Dict[str, '_Node'] = None,
+                 bucket: Tuple[Tuple[str, int], ...] = None):
+        self.children = children
+        self.top = top
+        self.bucket = bucket
+
+
+class SuggestTrie:
+    """노드별 상위 k개를 미리 계산한 접두어 트라이"""
+
+    def __init__(self, keys_by_rank: Sequence[Sequence[str]], k: int = DEFAULT_TOP_K):
+        """
+        keys_by_rank: Impact Factor 순위 순서로, 저널마다 정규화된 키 목록
+                      (예: [이름, ISSN])
+        """
+        self.k = k
+        # 저널 하나가 가진 최대 키 개수 (항목 수만 보고 분할 여부를 빨리 판단하기 위함)
+        self.keys_per_journal = max((len(keys) for keys in keys_by_rank), default=1)
+        entries = [(key, rank) for rank, keys in enumerate(keys_by_rank) for key in keys if key]
+        self.root = self._build(entries, 0)
+
+    def _top(self, entries: List[Tuple[str, int]]) -> Tuple[int, ...]:
+        """순위 순서 목록에서 중복 없는 앞쪽 k개"""
+        top = []
+        for _, rank in entries:
+            if rank not in top:
+                top.append(rank)
+                if len(top) == self.k:
+                    break
+        return tuple(top)
+
+    def _build(self, entries: List[Tuple[str, int]], depth: int) -> _Node:
+        """entries는 순위 오름차순이므로 그룹으로 나눠도 순서가 유지된다"""
+        top = self._top(entries)
+        if len(top) < self.k or depth >= MAX_DEPTH or (
+                len(entries) <= self.k * self.keys_per_journal and len({rank for _, rank in entries}) <= self.k):
+            return _Node(top, bucket=tuple(entries))
+
+        groups: Dict[str, List[Tuple[str, int]]] = {}
+        for entry in entries:
+            key = entry[0]
+            if len(key) > depth:
+                groups.setdefault(key[depth], []).append(entry)
+        children = {ch: self._build(group, depth + 1) for ch, group in groups.items()}
+        return _Node(top, children=children)
+
+    def lookup(self, prefix: str, limit: int = None) -> List[int]:
+        """접두어로 시작하는 키를 가진 저널의 순위 목록 (상위 limit개)"""
+        limit = self.k if limit is None else min(limit, self.k)
+        node = self.root
+        for ch in prefix:
+            if node.bucket is not None:
+                # 남은 항목이 k개 이하인 노드: 나머지 접두어로 직접 걸러낸다
+                ranks = []
+                for key, rank in node.bucket:
+                    if key.startswith(prefix) and rank not in ranks:
+                        ranks.append(rank)
+                        if len(ranks) == limit:
+                            break
+                return ranks
+            node = node.children.get(ch)
+            if node is None:
+                return []
+        return list(node.top[:limit])
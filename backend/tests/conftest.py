@@ -0,0 +1,13 @@
+"""
+테스트 공통 설정
+
+backend 모듈을 그대로 import할 수 있도록 backend 디렉터리를 경로에 추가한다.
+
+사용법 (backend에서):
+    python -m pytest tests
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
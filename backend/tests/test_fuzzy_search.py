@@ -0,0 +1,74 @@
+"""퍼지 검색 페이지/ISSN 우선/편집 거리 테스트"""
+
+import itertools
+import random
+
+import pytest
+
+from fuzzy_search import edit_distance, is_abbreviation
+from journal_catalog import JournalCatalog
+from synthetic_journals import generate_journals
+
+QUERIES = ['journal', 'Jornal Clinical Cardiolgy', 'Proc Natl', 'Adv Mater', 'Ne', 'annals surgery', 'xyzzy']
+
+
+@pytest.fixture(scope='module')
+def catalog():
+    journals = generate_journals(3000, seed=3)
+    # ISSN으로 찾은 저널이 퍼지 결과에도 나오는 경우를 만들기 위해 이름에 ISSN을 넣은 저널
+    journals.append({'name': 'Journal 1234-5679', 'issn': '1234-5679', 'impact_factor': 0.5,
+                     'category': 'Economics', 'quartile': 'Q4'})
+    return JournalCatalog(journals)
+
+
+def full_results(catalog, query):
+    scored, has_more = catalog.fuzzy_search_rows(query, 10_000)
+    assert not has_more
+    return scored
+
+
+@pytest.mark.parametrize('query', QUERIES + ['1234-5679', '12345679'])
+def test_pages_are_slices_of_the_full_ranking(catalog, query):
+    expected = full_results(catalog, query)
+    for limit, offset in itertools.product((1, 3, 20), (0, 1, 2, 5, 19, 40)):
+        page, has_more = catalog.fuzzy_search_rows(query, limit, offset)
+        assert page == expected[offset:offset + limit]
+        assert has_more == (len(expected) > offset + limit)
+
+
+def test_exact_issn_comes_first_once(catalog):
+    scored = full_results(catalog, '1234-5679')
+    row = catalog.issn_index['12345679']
+    assert scored[0] == (row, 1.0)
+    assert [r for r, _ in scored].count(row) == 1
+
+
+def reference_distance(a, b, limit):
+    """표를 모두 채우는 제한된 Damerau-Levenshtein 거리"""
+    d = [[i + j if i * j == 0 else 0 for j in range(len(b) + 1)] for i in range(len(a) + 1)]
+    for i in range(1, len(a) + 1):
+        for j in range(1, len(b) + 1):
+            d[i][j] = min(d[i - 1][j] + 1, d[i][j - 1] + 1, d[i - 1][j - 1] + (a[i - 1] != b[j - 1]))
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                d[i][j] = min(d[i][j], d[i - 2][j - 2] + 1)
+    return d[-1][-1] if d[-1][-1] <= limit else limit + 1
+
+
+def test_edit_distance_matches_reference():
+    rng = random.Random(0)
+    for _ in range(20_000):
+        a = ''.join(rng.choice('abcd') for _ in range(rng.randint(1, 9)))
+        b = ''.join(rng.choice('abcd') for _ in range(rng.randint(0, 9)))
+        for limit in (1, 2):
+            assert edit_distance(a, b, limit) == reference_distance(a, b, limit)
+    assert edit_distance('lancett', 'lancet', 2) == 1
+    assert edit_distance('fronteirs', 'frontiers', 2) == 1
+
+
+def test_abbreviations_and_typos_expand(catalog):
+    index = catalog._lazy_index('_fuzzy_index', catalog._build_fuzzy_index)
+    assert is_abbreviation('natl', 'national')
+    words = {index.words[w]: weight for w, weight in index.expand('jounral').items()}
+    assert words['journal'] == 0.6
+    words = {index.words[w]: weight for w, weight in index.expand('clin').items()}
+    assert words['clinical'] == 0.8
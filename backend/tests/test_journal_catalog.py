@@ -0,0 +1,116 @@
+"""JournalCatalog 통계/목록과 CatalogStore 교체 테스트"""
+
+import threading
+import time
+
+import pytest
+
+from catalog_loader import DEFAULT_CATALOG_PATH, CatalogStore, load_columns, load_snapshot, write_catalog
+from journal_catalog import JournalCatalog
+from synthetic_journals import generate_journals
+
+
+@pytest.fixture(scope='module')
+def journals():
+    return generate_journals(2000, seed=7)
+
+
+@pytest.fixture(scope='module')
+def catalog(journals):
+    return JournalCatalog(journals)
+
+
+def test_catalog_has_no_mutation_api(catalog):
+    # 카탈로그는 만든 뒤 바뀌지 않고, 변경은 CatalogStore 교체로만 반영된다
+    assert not hasattr(catalog, 'add_journal')
+    assert not hasattr(catalog, 'update_journal')
+
+
+def test_category_aggregates_match_full_scan(journals, catalog):
+    stats = catalog.stats()
+    assert stats['total_journals'] == len(journals)
+    for category, summary in stats['category_breakdown'].items():
+        values = [j['impact_factor'] for j in journals if j['category'] == category]
+        assert summary['count'] == len(values)
+        assert summary['avg_impact_factor'] == round(sum(values) / len(values), 2)
+        assert summary['min_impact_factor'] == min(values)
+        assert summary['max_impact_factor'] == max(values)
+        assert sorted(summary['journals']) == sorted(j['name'] for j in journals if j['category'] == category)
+    assert stats['impact_factor_stats']['max'] == max(j['impact_factor'] for j in journals)
+
+
+def test_category_top_percent_matches_rank(journals, catalog):
+    for journal in journals[:200]:
+        values = [j['impact_factor'] for j in journals if j['category'] == journal['category']]
+        rank = 1 + sum(value > journal['impact_factor'] for value in values)
+        found = catalog.get_by_issn(journal['issn'])
+        assert found['category_top_percent'] == round(rank * 100 / len(values), 2)
+
+
+def test_iter_rows_cursor_continues_sorted_order(catalog):
+    rows = list(catalog.iter_rows())
+    impact_factors = [catalog.records.impact_factors[row] for row in rows]
+    assert impact_factors == sorted(impact_factors, reverse=True)
+
+    middle = catalog.records.get(rows[500])
+    after = (middle['impact_factor'], middle['issn'])
+    assert list(catalog.iter_rows('', after)) == rows[501:]
+    assert catalog.filter_rows('', after=after).tolist() == rows[501:]
+
+
+def test_store_reload_swaps_whole_catalog(tmp_path, journals):
+    path = write_catalog(journals[:100], tmp_path / 'journals.db')
+    store = CatalogStore(path)
+    old = store.current
+    assert len(old) == 100
+
+    write_catalog(journals[:150], path)
+    assert store.reload()
+    new = store.current
+    assert new is not old
+    # 교체 전에 받은 스냅샷은 그대로 남아 진행 중인 요청이 끝까지 같은 내용을 본다
+    assert len(old) == 100 and len(new) == 150
+    assert new.version != old.version
+    assert new.content_hash != old.content_hash
+
+
+def test_lazy_indexes_build_once_under_concurrency(journals):
+    catalog = JournalCatalog(journals[:500])
+    catalog._fuzzy_index = None
+    built = []
+    build = catalog._build_fuzzy_index
+
+    def counting_build():
+        built.append(1)
+        return build()
+
+    catalog._build_fuzzy_index = counting_build
+    threads = [threading.Thread(target=catalog.fuzzy_search_rows, args=('journal', 5)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(built) == 1
+
+
+def test_reload_notification_reaches_other_workers(tmp_path, journals):
+    path = write_catalog(journals[:100], tmp_path / 'journals.db')
+    # 같은 카탈로그 파일을 쓰는 워커 두 개 (카탈로그 파일은 그대로이고 트리거만 바뀐다)
+    receiver = CatalogStore(path)
+    other = CatalogStore(path)
+    before = other.current
+    other.watch(0.05)
+
+    assert receiver.notify_workers()
+    assert receiver.reload()
+    for _ in range(100):
+        if other.current is not before:
+            break
+        time.sleep(0.05)
+    assert other.current is not before
+
+
+def test_committed_snapshot_is_current():
+    # 스냅샷 모듈을 고쳤으면 python catalog_loader.py로 data/의 스냅샷과 열 파일을 다시 만든다
+    assert load_snapshot(DEFAULT_CATALOG_PATH) is not None
+    assert load_columns(DEFAULT_CATALOG_PATH) is not None
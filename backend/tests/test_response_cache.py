@@ -0,0 +1,42 @@
+"""ResponseCache 한도/버전 테스트"""
+
+from response_cache import ResponseCache
+
+
+def test_byte_budget_evicts_least_recently_used():
+    cache = ResponseCache(max_entries=100, max_bytes=1000)
+    for key in range(40):
+        cache.set(1, key, b'x' * 50)
+    stats = cache.stats()
+    assert stats['bytes'] == 1000
+    assert stats['entries'] == 20
+    assert cache.get(1, 0) is None
+    assert cache.get(1, 39) == b'x' * 50
+
+
+def test_oversized_body_is_not_cached():
+    cache = ResponseCache(max_entries=100, max_bytes=1600)
+    cache.set(1, 'small', b'x' * 100)
+    cache.set(1, 'listing', b'x' * 101)
+    assert cache.get(1, 'listing') is None
+    assert cache.get(1, 'small') is not None
+    assert cache.stats()['oversized'] == 1
+
+
+def test_replacing_a_key_keeps_byte_count():
+    cache = ResponseCache(max_bytes=1600)
+    cache.set(1, 'a', b'x' * 100)
+    cache.set(1, 'a', b'x' * 30)
+    assert cache.stats()['bytes'] == 30
+
+
+def test_old_catalog_version_does_not_flush_new_entries():
+    cache = ResponseCache()
+    cache.set(1, 'a', b'old')
+    cache.set(2, 'a', b'new')
+    # 교체 전 스냅샷으로 처리 중인 요청
+    assert cache.get(1, 'a') is None
+    cache.set(1, 'b', b'old')
+    assert cache.get(2, 'a') == b'new'
+    assert cache.get(2, 'b') is None
+    assert cache.stats()['invalidations'] == 1